@@ -349,7 +349,11 @@ export const GameRoom = ({ roomName, playerName, playerRole, room }) => {
       if (!isMounted.current) return;
       try {
         const message = JSON.parse(new TextDecoder().decode(payload));
-        handleMessage(message);
+        if (message.type === 'batch') {
+          message.messages.forEach(handleMessage);
+        } else {
+          handleMessage(message);
+        }
       } catch (error) {
         console.error('Failed to parse data message:', error);
       }
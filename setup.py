@@ -9,6 +9,8 @@ setup(
         "tqdm",
         "absl-py",
         "openai",
+        "httpx",
+        "tenacity",
         "pyyaml",
         "google-genai",
         "anthropic",
@@ -16,7 +18,9 @@ setup(
         "pandas",
         "fastapi",
         "uvicorn[standard]",
-        "pydantic",
+        "uvloop",
+        "pydantic>=2",
+        "orjson",
         "livekit",
         "livekit-api",
         "aiohttp",
@@ -0,0 +1,46 @@
+import unittest
+
+from werewolf.apis_cache import LLMCache, cache_key
+
+
+class CacheKeyTest(unittest.TestCase):
+    def test_sampled_requests_are_not_cached(self):
+        self.assertIsNone(cache_key("model", "prompt", 1.0))
+        self.assertIsNone(cache_key("model", "prompt", None))
+
+    def test_options_are_part_of_the_key(self):
+        self.assertNotEqual(
+            cache_key("model", "prompt", 0, {"json_mode": True}),
+            cache_key("model", "prompt", 0, {"json_mode": False}),
+        )
+
+
+class CachedTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.calls = []
+        cache = LLMCache()
+
+        @cache.cached(lambda: "model")
+        async def generate(prompt: str, json_mode: bool = True, **kwargs):
+            self.calls.append(json_mode)
+            return "json" if json_mode else "text"
+
+        self.generate = generate
+
+    async def test_repeated_deterministic_call_hits_cache(self):
+        self.assertEqual(await self.generate(prompt="p", temperature=0), "json")
+        self.assertEqual(await self.generate(prompt="p", temperature=0), "json")
+        self.assertEqual(self.calls, [True])
+
+    async def test_json_mode_is_cached_separately(self):
+        self.assertEqual(
+            await self.generate(prompt="p", temperature=0, json_mode=True), "json"
+        )
+        self.assertEqual(
+            await self.generate(prompt="p", temperature=0, json_mode=False), "text"
+        )
+        self.assertEqual(self.calls, [True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,26 +14,51 @@
 
 
 from openai import AsyncOpenAI
+import asyncio
 import os
 
-from typing import Any, Optional
+import anthropic
+import httpx
+import openai
+
+from typing import Any, AsyncIterator, List, Optional
 import google
 from google import genai
+from google.genai import errors as genai_errors
 from anthropic import AsyncAnthropicVertex
 
 from dotenv import load_dotenv
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from werewolf.apis_cache import llm_cache
 
 load_dotenv(override=True)
 
+# One keep-alive connection pool shared by every provider client, so the game's
+# many sequential prompts don't each pay for a fresh TCP+TLS handshake.
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=100),
+    timeout=60.0,
+)
+
 # Initialize OpenAI client
-client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"), http_client=http_client)
 
 # Initialize Cerebras client
 cerebras_client = AsyncOpenAI(
     base_url="https://api.cerebras.ai/v1",
     api_key=os.environ.get("CEREBRAS_API_KEY", ""),
+    http_client=http_client,
 )
 
+# Built on first use since resolving the Google project needs credentials
+anthropic_client: Optional[AsyncAnthropicVertex] = None
+
 DEFAULT_MODEL = "openai"
 
 DEFAULT_OPENAI_MODEL = "gpt-4o"
@@ -41,59 +66,257 @@ DEFAULT_CLAUDE_MODEL = "claude-3-5-sonnet-20240620"
 DEFAULT_CEREBRAS_MODEL = "llama-4-scout-17b-16e-instruct"
 DEFAULT_GEMINI_MODEL = "gemini-2.5-flash-lite-preview-06-17"
 
+# Request fragments that never change, built once instead of per call
+_TEXT_FORMAT = {"type": "text"}
+_JSON_FORMAT = {"type": "json_object"}
+_JSON_STREAM_EXTRA = {"response_format": _JSON_FORMAT}
+_NO_EXTRA: dict[str, Any] = {}
+
+# OpenAI parameters the Cerebras API rejects, plus game-level options that are
+# only meaningful to other providers
+_UNSUPPORTED_CEREBRAS_PARAMS = frozenset(
+    {
+        "frequency_penalty",
+        "logit_bias",
+        "presence_penalty",
+        "parallel_tool_calls",
+        "service_tier",
+        "response_schema",
+        "disable_recitation",
+        "disable_safety_check",
+    }
+)
+
 # Initialize Google GenAI client
 genai_client = genai.Client(api_key=os.environ.get("GOOGLE_API_KEY"))
 
 
-async def generate(**kwargs):
-    if DEFAULT_MODEL == "openai":
+async def aclose():
+    """Close the shared HTTP connection pool."""
+    await http_client.aclose()
+
+
+# Per-provider caps on concurrent requests, sized to stay under account rate
+# limits when every player prompts at once.
+PROVIDER_CONCURRENCY = {
+    "openai": 50,
+    "claude": 20,
+    "gemini": 20,
+    "cerebras": 20,
+}
+_provider_semaphores = {
+    provider: asyncio.Semaphore(limit)
+    for provider, limit in PROVIDER_CONCURRENCY.items()
+}
+
+_TRANSIENT_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    anthropic.RateLimitError,
+    anthropic.APITimeoutError,
+    anthropic.APIConnectionError,
+    genai_errors.ServerError,
+)
+
+
+def _is_transient(e: BaseException) -> bool:
+    """Rate limits, timeouts and server errors are worth retrying."""
+    if isinstance(e, genai_errors.ClientError):
+        return e.code == 429
+    return isinstance(e, _TRANSIENT_ERRORS)
+
+
+# Jittered exponential backoff spreads retries out so a burst of 429s
+# doesn't turn into a synchronized retry storm.
+_retry_transient = retry(
+    retry=retry_if_exception(_is_transient),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(6),
+    reraise=True,
+)
+
+
+# Upper bound on provider calls in flight from a single generate_all() fanout
+FANOUT_CONCURRENCY = 8
+
+
+async def _dispatch(model: str, **kwargs):
+    if model == "openai":
         return await generate_openai(**kwargs)
-    elif DEFAULT_MODEL == "claude":
+    elif model == "claude":
         return await generate_authropic(**kwargs)
-    elif DEFAULT_MODEL == "cerebras" or DEFAULT_MODEL == "llama":
+    elif model == "cerebras" or model == "llama":
         return await generate_cerebras(**kwargs)
-    elif DEFAULT_MODEL == "gemini":
+    elif model == "gemini":
         return await generate_genai(**kwargs)
     else:
-        raise ValueError(f"Unknown model: {DEFAULT_MODEL}")
+        raise ValueError(f"Unknown model: {model}")
+
+
+async def generate(**kwargs):
+    return await _dispatch(DEFAULT_MODEL, **kwargs)
+
+
+async def generate_all(models: List[str], **kwargs) -> List[Any]:
+    """Sends the same request to several providers concurrently.
+
+    Returns one entry per model, in order; a failed provider yields its
+    exception instead of a response so one outage doesn't sink the others.
+    """
+    fanout_semaphore = asyncio.Semaphore(FANOUT_CONCURRENCY)
+
+    async def limited(model: str):
+        async with fanout_semaphore:
+            return await _dispatch(model, **kwargs)
+
+    tasks = [asyncio.create_task(limited(model)) for model in models]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def generate_stream(**kwargs) -> AsyncIterator[str]:
+    """Streams the response from DEFAULT_MODEL as text deltas.
+
+    Unlike generate(), streamed responses bypass the response cache.
+    """
+    if DEFAULT_MODEL == "openai":
+        stream = _stream_openai(client, DEFAULT_OPENAI_MODEL, **kwargs)
+    elif DEFAULT_MODEL == "cerebras" or DEFAULT_MODEL == "llama":
+        # Cerebras JSON mode is not compatible with streaming
+        kwargs["json_mode"] = False
+        stream = _stream_openai(cerebras_client, DEFAULT_CEREBRAS_MODEL, **kwargs)
+    elif DEFAULT_MODEL == "gemini":
+        stream = _stream_genai(**kwargs)
+    else:
+        raise ValueError(f"Streaming is not supported for model: {DEFAULT_MODEL}")
+    async for chunk in stream:
+        yield chunk
+
+
+async def read_json_object(chunks: AsyncIterator[str]) -> str:
+    """Consumes a text stream until the first top-level JSON object is complete.
+
+    Returns the text up to and including the closing brace, without waiting
+    for whatever the model emits after it. Returns everything read if the
+    object never closes.
+    """
+    buffer = []
+    depth = 0
+    in_string = False
+    escaped = False
+    try:
+        async for chunk in chunks:
+            for i, ch in enumerate(chunk):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == "\\":
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch == "{":
+                    depth += 1
+                elif ch == "}" and depth > 0:
+                    depth -= 1
+                    if depth == 0:
+                        buffer.append(chunk[: i + 1])
+                        return "".join(buffer)
+            buffer.append(chunk)
+    finally:
+        if hasattr(chunks, "aclose"):
+            await chunks.aclose()
+    return "".join(buffer)
 
 
 # openai
+@llm_cache.cached(lambda: DEFAULT_OPENAI_MODEL)
+@_retry_transient
 async def generate_openai(
-    prompt: str, json_mode: bool = True, temperature: float = 1.0, **kwargs
+    prompt: str,
+    json_mode: bool = True,
+    temperature: float = 1.0,
+    json_schema: dict[str, Any] | None = None,
+    **kwargs,
 ):
-    response_format = {"type": "text"}
-    if json_mode:
-        response_format = {"type": "json_object"}
-    response = await client.chat.completions.create(
-        messages=[{"role": "user", "content": prompt}],
-        response_format=response_format,
-        model=DEFAULT_OPENAI_MODEL,
-        temperature=temperature,
-    )
+    if json_schema is None:
+        json_schema = kwargs.get("response_schema")
+    response_format = _TEXT_FORMAT
+    if json_schema is not None:
+        # Strict structured outputs require closed objects
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "response",
+                "schema": {**json_schema, "additionalProperties": False},
+                "strict": True,
+            },
+        }
+    elif json_mode:
+        response_format = _JSON_FORMAT
+    async with _provider_semaphores["openai"]:
+        response = await client.chat.completions.create(
+            messages=[{"role": "user", "content": prompt}],
+            response_format=response_format,
+            model=DEFAULT_OPENAI_MODEL,
+            temperature=temperature,
+        )
 
     txt = response.choices[0].message.content
     return txt
 
 
+async def _stream_openai(
+    llm_client: AsyncOpenAI,
+    model: str,
+    prompt: str,
+    json_mode: bool = True,
+    temperature: float = 1.0,
+    **kwargs,
+) -> AsyncIterator[str]:
+    extra = _JSON_STREAM_EXTRA if json_mode else _NO_EXTRA
+    stream = await llm_client.chat.completions.create(
+        messages=[{"role": "user", "content": prompt}],
+        model=model,
+        temperature=temperature,
+        stream=True,
+        **extra,
+    )
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
 # anthropic
-async def generate_authropic(prompt: str, **kwargs):
+@llm_cache.cached(lambda: DEFAULT_CLAUDE_MODEL)
+@_retry_transient
+async def generate_authropic(prompt: str, temperature: float = 1.0, **kwargs):
     # For local development, run `gcloud auth application-default login` first to
     # create the application default credentials, which will be picked up
     # automatically here.
-    _, project_id = google.auth.default()
-    client = AsyncAnthropicVertex(region="us-east5", project_id=project_id)
+    global anthropic_client
+    if anthropic_client is None:
+        # google.auth.default() may hit the metadata server, so keep it off the loop.
+        _, project_id = await asyncio.to_thread(google.auth.default)
+        anthropic_client = AsyncAnthropicVertex(
+            region="us-east5", project_id=project_id, http_client=http_client
+        )
 
-    response = await client.messages.create(
-        model=DEFAULT_CLAUDE_MODEL,
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=1024,
-    )
+    async with _provider_semaphores["claude"]:
+        response = await anthropic_client.messages.create(
+            model=DEFAULT_CLAUDE_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=1024,
+            temperature=temperature,
+        )
 
     return response.content[0].text
 
 
 # google genai (replacing vertexai)
+@llm_cache.cached(lambda: DEFAULT_GEMINI_MODEL)
+@_retry_transient
 async def generate_genai(
     prompt: str,
     temperature: float = 0.7,
@@ -103,6 +326,9 @@ async def generate_genai(
 ) -> str:
     """Generates text content using Google GenAI client."""
 
+    if json_schema is None:
+        json_schema = kwargs.get("response_schema")
+
     config = {
         "temperature": temperature,
     }
@@ -113,26 +339,56 @@ async def generate_genai(
         if json_schema is not None:
             config["response_schema"] = json_schema
 
-    try:
-        response = await genai_client.aio.models.generate_content(
-            model=DEFAULT_GEMINI_MODEL, contents=prompt, config=config
-        )
+    async with _provider_semaphores["gemini"]:
+        try:
+            response = await genai_client.aio.models.generate_content(
+                model=DEFAULT_GEMINI_MODEL, contents=prompt, config=config
+            )
 
-        return response.text
+            return response.text
 
-    except Exception as e:
-        # Fallback without JSON constraints if there's an error
-        try:
+        except genai_errors.ClientError as e:
+            # Rate limits are transient; let the caller retry the constrained request
+            if e.code == 429:
+                raise
+            # Fallback without JSON constraints if the model rejected them; its
+            # errors propagate as-is so rate limits are still retried
             response = await genai_client.aio.models.generate_content(
                 model=DEFAULT_GEMINI_MODEL,
                 contents=prompt,
                 config={"temperature": temperature},
             )
             return response.text
-        except Exception as fallback_error:
-            raise Exception(f"GenAI generation failed: {fallback_error}")
 
 
+async def _stream_genai(
+    prompt: str,
+    temperature: float = 0.7,
+    json_mode: bool = True,
+    json_schema: dict[str, Any] | None = None,
+    **kwargs,
+) -> AsyncIterator[str]:
+    if json_schema is None:
+        json_schema = kwargs.get("response_schema")
+
+    config = {
+        "temperature": temperature,
+    }
+    if json_mode or json_schema is not None:
+        config["response_mime_type"] = "application/json"
+        if json_schema is not None:
+            config["response_schema"] = json_schema
+
+    stream = await genai_client.aio.models.generate_content_stream(
+        model=DEFAULT_GEMINI_MODEL, contents=prompt, config=config
+    )
+    async for chunk in stream:
+        if chunk.text:
+            yield chunk.text
+
+
+@llm_cache.cached(lambda: DEFAULT_CEREBRAS_MODEL)
+@_retry_transient
 async def generate_cerebras(
     prompt: str,
     temperature: float = 0.7,
@@ -176,28 +432,16 @@ async def generate_cerebras(
             raise ValueError(
                 "JSON mode is not compatible with streaming in Cerebras API"
             )
-        params["response_format"] = {"type": "json_object"}
+        params["response_format"] = _JSON_FORMAT
 
-    # Filter out unsupported parameters
-    unsupported_params = [
-        "frequency_penalty",
-        "logit_bias",
-        "presence_penalty",
-        "parallel_tool_calls",
-        "service_tier",
-        "response_schema",
-        "disable_recitation",
-        "disable_safety_check",
-    ]
-    for param in unsupported_params:
-        if param in kwargs:
-            del kwargs[param]
-
-    # Merge additional parameters
-    params.update(kwargs)
+    # Merge additional parameters, dropping the ones Cerebras doesn't support
+    params.update(
+        {k: v for k, v in kwargs.items() if k not in _UNSUPPORTED_CEREBRAS_PARAMS}
+    )
 
     try:
-        response = await cerebras_client.chat.completions.create(**params)
+        async with _provider_semaphores["cerebras"]:
+            response = await cerebras_client.chat.completions.create(**params)
 
         if hasattr(response, "choices") and len(response.choices) > 0:
             return response.choices[0].message.content
@@ -205,4 +449,6 @@ async def generate_cerebras(
             raise ValueError("Unexpected response format from Cerebras API")
 
     except Exception as e:
+        if _is_transient(e):
+            raise
         raise Exception(f"Error calling Cerebras API: {str(e)}")
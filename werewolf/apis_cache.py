@@ -0,0 +1,101 @@
+"""
+Exact-match cache for deterministic LLM calls
+"""
+import asyncio
+import functools
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+DEFAULT_TTL = 3600
+
+
+def cache_key(
+    model: str,
+    prompt: str,
+    temperature: Optional[float],
+    options: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
+    """Key for a generation request, or None if its output must not be cached.
+
+    Only temperature 0 requests are cached; anything sampled would replay one
+    random draw forever. `options` holds the request's other arguments, such as
+    `json_mode` or the response schema, since any of them can shape the output.
+    """
+    if temperature is None or temperature > 0:
+        return None
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "temperature": temperature,
+        "options": options or {},
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class LLMCache:
+    """In-process LRU cache of model responses with a per-entry TTL."""
+
+    def __init__(self, max_size: int = 1024, ttl: float = DEFAULT_TTL):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None):
+        async with self._lock:
+            expires_at = time.monotonic() + (self._ttl if ttl is None else ttl)
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def cached(self, model: Callable[[], str]):
+        """Decorate a `generate_*` coroutine so temperature 0 calls hit the cache.
+
+        `model` is called on each request so the key follows the provider's
+        currently configured model name.
+        """
+
+        def decorator(fn: Callable[..., Awaitable[str]]):
+            @functools.wraps(fn)
+            async def wrapper(prompt: str, **kwargs) -> str:
+                options = {k: v for k, v in kwargs.items() if k != "temperature"}
+                key = cache_key(model(), prompt, kwargs.get("temperature"), options)
+                if key is None:
+                    return await fn(prompt=prompt, **kwargs)
+
+                cached = await self.get(key)
+                if cached is not None:
+                    return cached
+
+                txt = await fn(prompt=prompt, **kwargs)
+                if txt is not None:
+                    await self.set(key, txt)
+                return txt
+
+            return wrapper
+
+        return decorator
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+llm_cache = LLMCache()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import random
 
 RETRIES = 3
@@ -37,6 +38,12 @@ NAMES = [
 RUN_SYNTHETIC_VOTES = False
 MAX_DEBATE_TURNS = 8
 NUM_PLAYERS = 8
+NUM_VILLAGERS = NUM_PLAYERS - 4  # 2 Werewolves, 1 Seer, 1 Doctor
+
+# LiveKit server and credentials shared by the API server and every player
+LIVEKIT_URL = os.getenv("LIVEKIT_URL", "wss://localhost:7880")
+LIVEKIT_API_KEY = os.getenv("LIVEKIT_API_KEY")
+LIVEKIT_API_SECRET = os.getenv("LIVEKIT_API_SECRET")
 
 
 def get_player_names():
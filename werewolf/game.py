@@ -18,27 +18,48 @@ import asyncio
 import logging
 import os
 import random
-from collections import Counter
-from typing import List, Optional, Tuple, Any
+from typing import Any, Callable, List, Optional, Tuple
 
 import tqdm
 from livekit import api
 
 from werewolf.config import MAX_DEBATE_TURNS, RUN_SYNTHETIC_VOTES
-from werewolf.model import LmLog, Round, RoundLog, State
+from werewolf.model import LmLog, Player, Round, RoundLog, State
 from werewolf.pipecat_human_player import PipecatHumanPlayer
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Maximum number of progress lines waiting to be written to the console
+LOG_QUEUE_SIZE = 1024
+
+# Seconds the human has to cast a vote, and the bound on a whole voting round
+HUMAN_VOTE_TIMEOUT = 30
+VOTING_TIMEOUT = 60
+
 
 def get_max_bids(d):
     """Gets all the keys with the highest value in the dictionary."""
-    max_value = max(d.values())
-    max_keys = [key for key, value in d.items() if value == max_value]
+    items = iter(d.items())
+    max_key, max_value = next(items)
+    max_keys = [max_key]
+    for key, value in items:
+        if value > max_value:
+            max_value = value
+            max_keys = [key]
+        elif value == max_value:
+            max_keys.append(key)
     return max_keys
 
 
+def _write_line(message: str):
+    """Write a progress line to the console; a failed write is logged, not raised."""
+    try:
+        tqdm.tqdm.write(message)
+    except Exception as e:
+        logger.error("Failed to write progress line: %s", e)
+
+
 class GameMaster:
 
     def __init__(
@@ -55,45 +76,101 @@ class GameMaster:
         self.current_round_num = len(self.state.rounds) if self.state.rounds else 0
         self.num_threads = num_threads
         self.logs: List[RoundLog] = []
+        # The round being played and its log; set once at the start of each round
+        self.this_round: Optional[Round] = None
+        self.this_round_log: Optional[RoundLog] = None
+        # Player objects of this_round.players, kept in the same order
+        self._active_players: List[Player] = []
         self.human_player: PipecatHumanPlayer | None = None
         self.human_players: List[PipecatHumanPlayer] = []  # Track all human players
 
+        # One debate transcript shared by every player's view, so each line is
+        # stored once instead of copied into N per-player lists
+        self._debate: List[Tuple[str, str]] = []
+        for p in self.state.players.values():
+            if p.gamestate:
+                p.gamestate.share_debate(self._debate)
+
+        # Progress lines are written to the console by a background task
+        self._log_q: asyncio.Queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._log_task: Optional[asyncio.Task] = None
+
+        # The steps of a round never change, so resolve which ones to await once
+        self._round_actions: List[Tuple[Callable[[], Any], str, bool]] = [
+            (action, message, asyncio.iscoroutinefunction(action))
+            for action, message in [
+                (
+                    self.run_night_actions,
+                    "The Werewolves are picking someone to remove from the game.\n"
+                    "The Doctor is protecting someone.\n"
+                    "The Seer is investigating someone.",
+                ),
+                (self.resolve_night_phase, ""),
+                (self.check_for_winner, "Checking for a winner after Night Phase."),
+                (self.run_day_phase, "The Players are debating and voting."),
+                (self.exile, ""),
+                (self.check_for_winner, "Checking for a winner after Day Phase."),
+                (self.run_summaries, "The Players are summarizing the debate."),
+            ]
+        ]
+
         # Find human players
+        debug = logger.isEnabledFor(logging.DEBUG)
         for p in self.state.players.values():
-            tqdm.tqdm.write(f"Player: {p.name}, Type: {type(p)}")
+            if debug:
+                logger.debug("Player: %s, Type: %s", p.name, type(p))
             if isinstance(p, PipecatHumanPlayer):
                 self.human_players.append(p)
                 if not self.human_player:  # Keep first human player as primary for backwards compatibility
                     self.human_player = p
-                tqdm.tqdm.write(f"Human player found: {p.name}")
+                logger.info("Human player found: %s", p.name)
+        self._human_name = self.human_player.name if self.human_player else None
 
     async def broadcast_to_human(self, message_type: str, data=None):
         """Broadcast message to human player if present."""
-        if self.human_player:
+        if not self.human_player:
+            return
+        try:
             if message_type == "announcement":
                 await self.human_player.broadcast_announcement(data)
             elif message_type == "game_state":
                 await self.human_player.send_game_state_update("game_state", data)
+        except Exception as e:
+            logger.error(f"Failed to broadcast {message_type} to human player: {e}")
 
-    @property
-    def this_round(self) -> Round:
-        return self.state.rounds[self.current_round_num]
-
-    @property
-    def this_round_log(self) -> RoundLog:
-        return self.logs[self.current_round_num]
+    def _write(self, message: str):
+        """Queue a progress line for the console writer instead of blocking on it."""
+        if self._log_task is None:
+            _write_line(message)
+            return
+        try:
+            self._log_q.put_nowait(message)
+        except asyncio.QueueFull:
+            _write_line(message)
+
+    async def _drain_log(self):
+        """Write queued progress lines in order."""
+        while True:
+            _write_line(await self._log_q.get())
+            self._log_q.task_done()
+
+    def _flush_log(self):
+        """Write any progress lines still queued."""
+        while not self._log_q.empty():
+            _write_line(self._log_q.get_nowait())
+            self._log_q.task_done()
 
     async def eliminate(self):
         """Werewolves choose a player to eliminate."""
         werewolves_alive = [
-            w for w in self.state.werewolves if w.name in self.this_round.players
+            w for w in self.state.werewolves if self.this_round.has_player(w.name)
         ]
         wolf = random.choice(werewolves_alive)
         eliminated, log = await wolf.eliminate()
         self.this_round_log.eliminate = log
         if eliminated is not None:
             self.this_round.eliminated = eliminated
-            tqdm.tqdm.write(f"{wolf.name} eliminated {eliminated}")
+            self._write(f"{wolf.name} eliminated {eliminated}")
             for wolf in werewolves_alive:
                 wolf._add_observation(
                     "During the"
@@ -105,7 +182,7 @@ class GameMaster:
 
     async def protect(self):
         """Doctor chooses a player to protect."""
-        if self.state.doctor.name not in self.this_round.players:
+        if not self.this_round.has_player(self.state.doctor.name):
             return  # Doctor no longer in the game
 
         protect, log = await self.state.doctor.save()
@@ -113,17 +190,17 @@ class GameMaster:
 
         if protect is not None:
             self.this_round.protected = protect
-            tqdm.tqdm.write(f"{self.state.doctor.name} protected {protect}")
+            self._write(f"{self.state.doctor.name} protected {protect}")
         else:
             raise ValueError("Protect did not return a valid player.")
 
     async def unmask(self):
         """Seer chooses a player to unmask."""
-        if self.state.seer.name not in self.this_round.players:
+        if not self.this_round.has_player(self.state.seer.name):
             return  # Seer no longer in the game
 
         unmask, log = await self.state.seer.unmask()
-        tqdm.tqdm.write(f"{self.state.seer.name} unmasked {unmask}")
+        self._write(f"{self.state.seer.name} unmasked {unmask}")
         self.this_round_log.investigate = log
 
         if unmask is not None:
@@ -132,6 +209,10 @@ class GameMaster:
         else:
             raise ValueError("Unmask function did not return a valid player.")
 
+    async def run_night_actions(self):
+        """Werewolves, Doctor and Seer act at once; none depends on another's choice."""
+        await asyncio.gather(self.eliminate(), self.protect(), self.unmask())
+
     async def _get_bid(self, player_name):
         """Gets the bid for a specific player."""
         player = self.state.players[player_name]
@@ -142,69 +223,83 @@ class GameMaster:
                 " in the `bid` field in the log"
             )
         if bid > 1:
-            tqdm.tqdm.write(f"{player_name} bid: {bid}")
+            self._write(f"{player_name} bid: {bid}")
         return bid, log
 
     async def get_next_speaker(self):
-        """Determine the next speaker based on bids."""
+        """Determine the next speaker based on bids.
+
+        Returns the speaker with the bids and bid logs behind the choice, which
+        are left for the caller to record; both are None if no auction was held.
+        """
+        this_round = self.this_round
         previous_speaker, previous_dialogue = (
-            self.this_round.debate[-1] if self.this_round.debate else (None, None)
+            this_round.debate[-1] if this_round.debate else (None, None)
         )
 
+        # The human bids separately in run_day_phase
+        exclude = {previous_speaker, self._human_name}
         ai_players_to_bid = [
             player_name
-            for player_name in self.this_round.players
-            if player_name != previous_speaker
-            and (not self.human_player or player_name != self.human_player.name)
+            for player_name in this_round.players
+            if player_name not in exclude
         ]
 
         if not ai_players_to_bid:
-            return None
+            return None, None, None
+        if len(ai_players_to_bid) == 1:
+            # A lone candidate wins any auction, so skip the bid round trip
+            return ai_players_to_bid[0], None, None
 
-        bid_coroutines = [
-            self._get_bid(player_name) for player_name in ai_players_to_bid
+        bid_results = await asyncio.gather(
+            *(self._get_bid(player_name) for player_name in ai_players_to_bid)
+        )
+        bids = {
+            player_name: bid
+            for player_name, (bid, _) in zip(ai_players_to_bid, bid_results)
+        }
+        bid_log = [
+            (player_name, log)
+            for player_name, (_, log) in zip(ai_players_to_bid, bid_results)
         ]
-        bid_results = await asyncio.gather(*bid_coroutines)
-        bid_log = []
-        bids = {}
-        for i, player_name in enumerate(ai_players_to_bid):
-            bid, log = bid_results[i]
-            bids[player_name] = bid
-            bid_log.append((player_name, log))
-
-        self.this_round.bids.append(bids)
-        self.this_round_log.bid.append(bid_log)
 
         potential_speakers = get_max_bids(bids)
         # Prioritize mentioned speakers if there's previous dialogue
-        if previous_dialogue:
-            potential_speakers.extend(
-                [name for name in potential_speakers if name in previous_dialogue]
-            )
+        if not previous_dialogue:
+            return random.choice(potential_speakers), bids, bid_log
+        weights = [2 if name in previous_dialogue else 1 for name in potential_speakers]
+        return random.choices(potential_speakers, weights=weights)[0], bids, bid_log
+
+    @staticmethod
+    def _discard_bids(task):
+        """Cancel an unneeded AI bid round, still reporting it if it had failed."""
 
-        random.shuffle(potential_speakers)
-        return random.choice(potential_speakers)
+        def log_failure(task):
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning("Discarded AI bids failed: %r", task.exception())
+
+        task.cancel()
+        task.add_done_callback(log_failure)
 
     async def run_summaries(self):
         """Collect summaries from players after the debate."""
 
-        players = self.this_round.players
-        summary_coroutines = [self.state.players[name].summarize() for name in players]
-        summary_results = await asyncio.gather(*summary_coroutines)
-
-        summaries = {}
-        summary_log = []
-        for i, player_name in enumerate(players):
-            summary, log = summary_results[i]
-            if summary is not None:
-                summaries[player_name] = summary
-            summary_log.append((player_name, log))
+        players = self._active_players
+        summary_results = await asyncio.gather(*(p.summarize() for p in players))
 
-        self.this_round.summaries = summaries
-        self.this_round_log.summaries = summary_log
+        self.this_round.summaries = {
+            player.name: summary
+            for player, (summary, _) in zip(players, summary_results)
+            if summary is not None
+        }
+        self.this_round_log.summaries = [
+            (player.name, log) for player, (_, log) in zip(players, summary_results)
+        ]
 
     async def run_day_phase(self):
         """Run the day phase which consists of the debate and voting."""
+        this_round = self.this_round
+        this_round_log = self.this_round_log
 
         # Reset human player vote at start of day phase
         if self.human_player:
@@ -214,31 +309,43 @@ class GameMaster:
                 {
                     "round": self.current_round_num
                     + 1,  # Display round number starting from 1
-                    "players": self.this_round.players,
+                    "players": this_round.players,
                     "phase": "debate",
                 },
             )
 
+        # Nobody leaves the game during the debate, so this holds for every turn
+        human_can_speak = self.human_player and this_round.has_player(self._human_name)
         debate_ended_early = False
         for idx in range(MAX_DEBATE_TURNS):
             next_speaker = None
-            human_can_speak = (
-                self.human_player and self.human_player.name in self.this_round.players
-            )
-
+            ai_speaker = None
             if human_can_speak:
-                # Check if human player wants to speak using LiveKit bid system
-                bid, log = await self.human_player.bid()
-                self.this_round_log.bid.append([(self.human_player.name, log)])
+                # Run the AI bids while the human decides; they only matter if
+                # the human passes
+                ai_speaker = asyncio.ensure_future(self.get_next_speaker())
+                try:
+                    # Check if human player wants to speak using LiveKit bid system
+                    bid, log = await self.human_player.bid()
+                except BaseException:
+                    self._discard_bids(ai_speaker)
+                    raise
+                this_round_log.bid.append([(self._human_name, log)])
 
                 if bid > 0:
-                    next_speaker = self.human_player.name
+                    next_speaker = self._human_name
+                    self._discard_bids(ai_speaker)
 
             if next_speaker is None:
-                next_speaker = await self.get_next_speaker()
+                if ai_speaker is None:
+                    ai_speaker = self.get_next_speaker()
+                next_speaker, bids, bid_log = await ai_speaker
+                if bids is not None:
+                    this_round.bids.append(bids)
+                    this_round_log.bid.append(bid_log)
 
             if not next_speaker:
-                tqdm.tqdm.write("No one else wishes to speak. The debate concludes.")
+                self._write("No one else wishes to speak. The debate concludes.")
                 debate_ended_early = True
                 break
 
@@ -249,16 +356,11 @@ class GameMaster:
                     f"{next_speaker} did not return a valid dialouge from debate()."
                 )
 
-            self.this_round_log.debate.append((next_speaker, log))
-            self.this_round.debate.append([next_speaker, dialogue])
-            tqdm.tqdm.write(f"{next_speaker} ({player.role}): {dialogue}")
+            this_round_log.debate.append((next_speaker, log))
+            this_round.debate.append([next_speaker, dialogue])
+            self._write(f"{next_speaker} ({player.role}): {dialogue}")
 
-            for name in self.this_round.players:
-                player = self.state.players[name]
-                if player.gamestate:
-                    player.gamestate.update_debate(next_speaker, dialogue)
-                else:
-                    raise ValueError(f"{name}.gamestate needs to be initialized.")
+            self._update_debate(next_speaker, dialogue)
 
             # Update human player with latest debate
             if self.human_player:
@@ -267,7 +369,7 @@ class GameMaster:
                     {
                         "speaker": next_speaker,
                         "dialogue": dialogue,
-                        "turn": len(self.this_round.debate),
+                        "turn": len(this_round.debate),
                     },
                 )
 
@@ -275,13 +377,13 @@ class GameMaster:
             # This should not run during interactive play.
             if RUN_SYNTHETIC_VOTES and not self.human_player:
                 votes, vote_logs = await self.run_voting()
-                self.this_round.votes.append(votes)
-                self.this_round_log.votes.append(vote_logs)
+                this_round.votes.append(votes)
+                this_round_log.votes.append(vote_logs)
 
         # The definitive vote happens once the debate is over.
         # If we were running synthetic votes, the final vote is already captured.
         if not RUN_SYNTHETIC_VOTES or self.human_player:
-            tqdm.tqdm.write("\nThe debate has concluded. Time to vote.")
+            self._write("\nThe debate has concluded. Time to vote.")
             if self.human_player:
                 await self.human_player.send_game_state_update(
                     "voting_phase",
@@ -291,11 +393,11 @@ class GameMaster:
                     },
                 )
             votes, vote_logs = await self.run_voting()
-            self.this_round.votes.append(votes)
-            self.this_round_log.votes.append(vote_logs)
+            this_round.votes.append(votes)
+            this_round_log.votes.append(vote_logs)
 
-        for player, vote in self.this_round.votes[-1].items():
-            tqdm.tqdm.write(f"{player} voted to remove {vote}")
+        for player, vote in this_round.votes[-1].items():
+            self._write(f"{player} voted to remove {vote}")
 
     async def run_voting(self):
         """Conduct a vote among players to exile someone."""
@@ -314,26 +416,22 @@ class GameMaster:
             )
 
         # Collect votes from all players
-        vote_coroutines = []
-        for name in players:
-            player = self.state.players[name]
+        vote_tasks = []
+        for player in self._active_players:
+            name = player.name
             if isinstance(player, PipecatHumanPlayer):
                 # For human players, wait for their vote through the UI
-                vote_coroutines.append(self._collect_human_vote(player))
+                vote_coroutine = self._collect_human_vote(player)
             else:
                 # For AI players, get their vote directly
-                vote_coroutines.append(player.vote())
+                vote_coroutine = player.vote()
+            vote_tasks.append(asyncio.ensure_future(self._cast_vote(name, vote_coroutine)))
 
-        # Wait for all votes to be cast with a timeout
+        # Process votes as they arrive so a slow voter doesn't hold back the
+        # others, with a timeout on the whole vote
         try:
-            vote_results = await asyncio.wait_for(
-                asyncio.gather(*vote_coroutines, return_exceptions=True),
-                timeout=60,  # 60 second timeout for voting
-            )
-
-            # Process the votes
-            for i, result in enumerate(vote_results):
-                player_name = players[i]
+            for next_vote in asyncio.as_completed(vote_tasks, timeout=VOTING_TIMEOUT):
+                player_name, result = await next_vote
                 if isinstance(result, Exception):
                     logger.error(f"Error getting vote from {player_name}: {result}")
                     continue
@@ -350,7 +448,14 @@ class GameMaster:
                             "vote_received", {"voter": player_name, "target": vote}
                         )
         except asyncio.TimeoutError:
-            logger.warning("Voting timed out, proceeding with current votes")
+            # Votes that already arrived were recorded above; only drop the rest
+            late = [task for task in vote_tasks if not task.done()]
+            logger.warning(
+                f"Voting timed out with {len(late)} vote(s) outstanding, proceeding"
+                " with current votes"
+            )
+            for task in late:
+                task.cancel()
 
         # Notify that voting has ended
         if self.human_player:
@@ -360,13 +465,19 @@ class GameMaster:
 
         return votes, vote_log
 
+    async def _cast_vote(self, player_name, vote_coroutine):
+        """Await one player's vote, returning the error instead of raising it."""
+        try:
+            return player_name, await vote_coroutine
+        except Exception as e:
+            return player_name, e
+
     async def _collect_human_vote(self, human_player):
         """Helper method to collect vote from human player with timeout."""
         try:
             # This will wait for the human to vote through the UI
-            vote, log = await asyncio.wait_for(
-                human_player.vote(), timeout=30  # 30 seconds for human to vote
-            )
+            async with asyncio.timeout(HUMAN_VOTE_TIMEOUT):
+                vote, log = await human_player.vote()
             return vote, log
         except asyncio.TimeoutError:
             logger.warning(f"{human_player.name} did not vote in time")
@@ -378,19 +489,24 @@ class GameMaster:
 
     async def exile(self):
         """Exile the player who received the most votes."""
-        if not self.this_round.votes:
+        this_round = self.this_round
+        if not this_round.votes:
             logger.warning("No votes recorded in this round")
             return
 
-        vote_counts = Counter(self.this_round.votes[-1].values())
+        votes = this_round.votes[-1]
+        vote_counts = {}
+        most_voted, vote_count = None, 0
+        for target in votes.values():
+            count = vote_counts[target] = vote_counts.get(target, 0) + 1
+            if count > vote_count:
+                most_voted, vote_count = target, count
         if not vote_counts:
             logger.warning("No valid votes to count")
             return
 
-        most_voted, vote_count = vote_counts.most_common(1)[0]
-        total_voters = len(
-            [p for p in self.this_round.players if p in self.this_round.votes[-1]]
-        )
+        # Votes are only collected from players still in the round
+        total_voters = len(votes)
 
         # Notify about the voting results
         if self.human_player:
@@ -398,7 +514,7 @@ class GameMaster:
                 "voting_results",
                 {
                     "results": {
-                        "vote_counts": dict(vote_counts),
+                        "vote_counts": vote_counts,
                         "most_voted": most_voted,
                         "vote_count": vote_count,
                         "total_voters": total_voters,
@@ -409,10 +525,10 @@ class GameMaster:
             )
 
         if vote_count > total_voters / 2:
-            self.this_round.exiled = most_voted
+            this_round.exiled = most_voted
 
-        if self.this_round.exiled is not None:
-            exiled_player = self.this_round.exiled
+        if this_round.exiled is not None:
+            exiled_player = this_round.exiled
             # Notify about the exile
             if self.human_player:
                 await self.human_player.send_game_state_update(
@@ -426,13 +542,7 @@ class GameMaster:
                 "target": exiled_player,
                 "round": self.current_round_num,
             }
-            # Update gamestate for all players first
-            for name in self.this_round.players:
-                player = self.state.players[name]
-                if player.gamestate:
-                    player.gamestate.remove_player(exiled_player)
-            # Then remove from the round's active players
-            self.this_round.players.remove(exiled_player)
+            self._remove_and_announce(exiled_player, announcement)
         else:
             announcement = (
                 "A majority vote was not reached, so no one was removed from the"
@@ -443,20 +553,37 @@ class GameMaster:
                 "target": None,
                 "round": self.current_round_num,
             }
-        # Announce to remaining players
-        for name in self.this_round.players:
-            player = self.state.players[name]
-            player.add_announcement(announcement)
+            self._remove_and_announce(None, announcement)
 
-        tqdm.tqdm.write(announcement)
+        self._write(announcement)
 
         # Broadcast to human player through LiveKit
         await self.broadcast_to_human("announcement", ui_announcement)
 
+    def _update_debate(self, speaker: str, dialogue: str):
+        """Record a line of the debate in the transcript every view shares."""
+        self._debate.append((speaker, dialogue))
+
+    def _remove_and_announce(self, removed: Optional[str], announcement: str):
+        """Remove a player (if any) and announce it to the rest in one pass."""
+        remaining = []
+        for player in self._active_players:
+            if removed is not None and player.gamestate:
+                player.gamestate.remove_player(removed)
+            # Announce to remaining players
+            if player.name != removed:
+                player.add_announcement(announcement)
+                remaining.append(player)
+        # Then remove from the round's active players
+        if removed is not None:
+            self.this_round.remove_player(removed)
+            self._active_players = remaining
+
     async def resolve_night_phase(self):
         """Resolve elimination and protection during the night phase."""
-        eliminated_player = self.this_round.eliminated
-        protected_player = self.this_round.protected
+        this_round = self.this_round
+        eliminated_player = this_round.eliminated
+        protected_player = this_round.protected
 
         if eliminated_player and eliminated_player != protected_player:
             announcement = (
@@ -468,13 +595,7 @@ class GameMaster:
                 "target": eliminated_player,
                 "round": self.current_round_num,
             }
-            # Update gamestate for all players first
-            for name in self.this_round.players:
-                player = self.state.players[name]
-                if player.gamestate:
-                    player.gamestate.remove_player(eliminated_player)
-            # Then remove from the round's active players
-            self.this_round.players.remove(eliminated_player)
+            self._remove_and_announce(eliminated_player, announcement)
         else:
             announcement = "No one was removed from the game during the night."
             ui_announcement = {
@@ -482,26 +603,25 @@ class GameMaster:
                 "target": None,
                 "round": self.current_round_num,
             }
-        tqdm.tqdm.write(announcement)
-
-        # Announce to remaining players
-        for name in self.this_round.players:
-            player = self.state.players[name]
-            player.add_announcement(announcement)
+            self._remove_and_announce(None, announcement)
+        self._write(announcement)
 
         # Broadcast to human player through LiveKit
         await self.broadcast_to_human("announcement", ui_announcement)
 
     async def run_round(self):
         """Run a single round of the game."""
-        self.state.rounds.append(Round())
-        self.logs.append(RoundLog())
+        this_round = self.this_round = Round()
+        self.this_round_log = RoundLog()
+        self.state.rounds.append(this_round)
+        self.logs.append(self.this_round_log)
 
-        self.this_round.players = (
-            list(self.state.players.keys())
+        this_round.set_players(
+            self.state.players.keys()
             if self.current_round_num == 0
-            else self.state.rounds[self.current_round_num - 1].players.copy()
+            else self.state.rounds[self.current_round_num - 1].players
         )
+        self._active_players = [self.state.players[name] for name in this_round.players]
 
         # Notify about night phase start
         if self.human_player:
@@ -509,48 +629,34 @@ class GameMaster:
                 "night_phase_start",
                 {
                     "round": self.current_round_num + 1,
-                    "players": self.this_round.players,
+                    "players": this_round.players,
                     "phase": "night",
                 },
             )
 
-        for action, message in [
-            (
-                self.eliminate,
-                "The Werewolves are picking someone to remove from the game.",
-            ),
-            (self.protect, "The Doctor is protecting someone."),
-            (self.unmask, "The Seer is investigating someone."),
-            (self.resolve_night_phase, ""),
-            (self.check_for_winner, "Checking for a winner after Night Phase."),
-            (self.run_day_phase, "The Players are debating and voting."),
-            (self.exile, ""),
-            (self.check_for_winner, "Checking for a winner after Day Phase."),
-            (self.run_summaries, "The Players are summarizing the debate."),
-        ]:
-            tqdm.tqdm.write(message)
-            if asyncio.iscoroutinefunction(action):
+        for action, message, is_coroutine in self._round_actions:
+            self._write(message)
+            if is_coroutine:
                 await action()
             else:
                 action()
 
             if self.state.winner:
-                tqdm.tqdm.write(f"Round {self.current_round_num} is complete.")
-                self.this_round.success = True
+                self._write(f"Round {self.current_round_num} is complete.")
+                this_round.success = True
                 return
             if not self.check_human_players_connected():
                 # if all human players disconnected, end the round
                 return
 
-        tqdm.tqdm.write(f"Round {self.current_round_num} is complete.")
-        self.this_round.success = True
+        self._write(f"Round {self.current_round_num} is complete.")
+        this_round.success = True
 
     def get_winner(self) -> str:
         """Determine the winner of the game."""
-        active_wolves = set(self.this_round.players) & set(
-            w.name for w in self.state.werewolves
-        )
-        active_villagers = set(self.this_round.players) - active_wolves
+        players = self.this_round.player_set
+        active_wolves = players & self.state.werewolf_names
+        active_villagers = players - active_wolves
         if len(active_wolves) >= len(active_villagers):
             return "Werewolves"
         return "Villagers" if not active_wolves else ""
@@ -559,7 +665,7 @@ class GameMaster:
         """Check if there is a winner and update the state accordingly."""
         self.state.winner = self.get_winner()
         if self.state.winner:
-            tqdm.tqdm.write(f"The winner is {self.state.winner}!")
+            self._write(f"The winner is {self.state.winner}!")
 
     def check_human_players_connected(self) -> bool:
         """Check if any human players are still connected to the game."""
@@ -571,22 +677,26 @@ class GameMaster:
 
     async def run_game(self) -> str:
         """Run the entire Werewolf game and return the winner."""
-        while not self.state.winner:
-            # Check if any human players are still connected
-            if not self.check_human_players_connected():
-                tqdm.tqdm.write("All human players disconnected. Ending game.")
-                self.state.winner = "Game Aborted - All Players Disconnected"
-                break
-
-            tqdm.tqdm.write(f"STARTING ROUND: {self.current_round_num}")
-            await self.run_round()
-            for name in self.this_round.players:
-                if self.state.players[name].gamestate:
-                    self.state.players[name].gamestate.round_number = (
-                        self.current_round_num + 1
-                    )
-                    self.state.players[name].gamestate.clear_debate()
-            self.current_round_num += 1            
-
-        tqdm.tqdm.write("Game is complete!")
+        self._log_task = asyncio.create_task(self._drain_log())
+        try:
+            while not self.state.winner:
+                # Check if any human players are still connected
+                if not self.check_human_players_connected():
+                    self._write("All human players disconnected. Ending game.")
+                    self.state.winner = "Game Aborted - All Players Disconnected"
+                    break
+
+                self._write(f"STARTING ROUND: {self.current_round_num}")
+                await self.run_round()
+                for player in self._active_players:
+                    if player.gamestate:
+                        player.gamestate.round_number = self.current_round_num + 1
+                self._debate.clear()
+                self.current_round_num += 1
+
+            self._write("Game is complete!")
+        finally:
+            self._log_task.cancel()
+            self._log_task = None
+            self._flush_log()
         return self.state.winner
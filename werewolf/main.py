@@ -1,16 +1,23 @@
 import asyncio
+import functools
 import os
 import uuid
 import random
-from typing import Dict, Any, List, Set
+import secrets
+import string
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Annotated, Dict, Any, List, Optional, Set
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 import logging
 
 from livekit import api
-from werewolf import game
+from werewolf import apis, game
 from werewolf.model import (
     State,
     SEER,
@@ -22,15 +29,36 @@ from werewolf.model import (
     Werewolf,
     Villager,
 )
-from werewolf.pipecat_human_player import PipecatHumanPlayer
+from werewolf.pipecat_human_player import PipecatHumanPlayer, vad_pool
 from werewolf.pipecat_ai_player import PipecatAIPlayer
-from werewolf.config import get_player_names
+from werewolf.config import LIVEKIT_API_KEY, LIVEKIT_API_SECRET, LIVEKIT_URL, NAMES
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Werewolf Game API")
+
+def _log_level_from_env() -> int:
+    """WEREWOLF_LOG_LEVEL as a logging level, falling back to INFO if unknown."""
+    name = os.getenv("WEREWOLF_LOG_LEVEL", "INFO").strip().upper()
+    level = logging.getLevelNamesMapping().get(name)
+    if level is None:
+        logger.warning("Unknown WEREWOLF_LOG_LEVEL %r, using INFO", name)
+        return logging.INFO
+    return level
+
+
+# Set WEREWOLF_LOG_LEVEL=WARNING in production so INFO calls short-circuit.
+# Run as a script this module logs as __main__, outside the werewolf package.
+_log_level = _log_level_from_env()
+for _logger_name in {"werewolf", __name__}:
+    logging.getLogger(_logger_name).setLevel(_log_level)
+
+# Route handlers are declared `async def`: they only touch in-memory state, so
+# running them on the event loop avoids FastAPI's threadpool hop for sync `def`
+# routes. Offload a specific blocking call with `asyncio.to_thread` instead of
+# turning the whole handler into a sync route.
+app = FastAPI(title="Werewolf Game API", default_response_class=ORJSONResponse)
 
 # Enable CORS
 app.add_middleware(
@@ -41,49 +69,139 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global room and game management
-active_games: Dict[str, game.GameMaster] = {}
-rooms: Dict[str, Dict[str, Any]] = {}  # room_id -> room_info
-room_id_to_name: Dict[str, str] = {}  # room_id -> room_name mapping
+# Names AI players are drawn from; read once instead of per game start
+_ALL_PLAYER_NAMES: List[str] = list(NAMES)
+
+# AI player class for each role
+_ROLE_CLASS = {SEER: Seer, DOCTOR: Doctor, WEREWOLF: Werewolf, VILLAGER: Villager}
+
+# Seconds to wait for every human to join their pipeline before giving up
+HUMAN_SETUP_TIMEOUT = 120
+
 
-# LiveKit configuration
-LIVEKIT_URL = os.getenv("LIVEKIT_URL", "wss://localhost:7880")
-LIVEKIT_API_KEY = os.getenv("LIVEKIT_API_KEY")
-LIVEKIT_API_SECRET = os.getenv("LIVEKIT_API_SECRET")
+@dataclass(slots=True)
+class RoomEntry:
+    """Everything the server tracks for one room, including its running game."""
+
+    room_name: str
+    creator: str
+    players: Dict[str, Dict[str, Any]]
+    created_at: float
+    game_started: bool = False
+    gamemaster: Optional[game.GameMaster] = None
+    winner: Optional[str] = None
+    ready_count: int = 0  # players whose "ready" flag is set
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)  # serializes start-game
+
+
+# Global room and game management
+rooms: Dict[str, RoomEntry] = {}  # room_id -> room
+room_name_to_id: Dict[str, str] = {}  # LiveKit room_name -> room_id
 
 if not LIVEKIT_API_KEY or not LIVEKIT_API_SECRET:
     raise ValueError(
         "LIVEKIT_API_KEY and LIVEKIT_API_SECRET environment variables must be set"
     )
 
+# Grants shared by every participant token; only the room varies.
+_GRANTS_KWARGS = dict(
+    room_join=True,
+    can_publish=True,
+    can_subscribe=True,
+    can_publish_data=True,
+)
+# Tokens are re-signed once per bucket; LiveKit's default TTL is much longer.
+_TOKEN_BUCKET_SECONDS = 3600
+
+
+@functools.lru_cache(maxsize=1024)
+def _mint_token(identity: str, name: str, room: str, bucket: int) -> str:
+    """Sign a LiveKit access token. `bucket` only takes part in the cache key."""
+    token = api.AccessToken(LIVEKIT_API_KEY, LIVEKIT_API_SECRET)
+    token.with_identity(identity).with_name(name)
+    token.with_grants(api.VideoGrants(room=room, **_GRANTS_KWARGS))
+    return token.to_jwt()
+
+
+def mint_token(identity: str, name: str, room: str) -> str:
+    """Return a LiveKit JWT, reusing one signed earlier in the same time bucket."""
+    return _mint_token(identity, name, room, int(time.time() // _TOKEN_BUCKET_SECONDS))
+
+
+_REQUEST_CONFIG = ConfigDict(frozen=True, extra="ignore")
+PlayerName = Annotated[str, Field(min_length=1, max_length=64)]
+RoomId = Annotated[str, Field(min_length=1, max_length=64)]
+
 
 class CreateRoomRequest(BaseModel):
-    room_name: str
-    creator_name: str
+    model_config = _REQUEST_CONFIG
+
+    room_name: str = Field(max_length=128)  # Empty means generate one
+    creator_name: PlayerName
 
 
 class JoinRoomRequest(BaseModel):
-    room_id: str
-    player_name: str
+    model_config = _REQUEST_CONFIG
+
+    room_id: RoomId
+    player_name: PlayerName
 
 
 class SetReadyRequest(BaseModel):
-    room_id: str
-    player_name: str
+    model_config = _REQUEST_CONFIG
+
+    room_id: RoomId
+    player_name: PlayerName
     is_ready: bool
 
 
 class StartGameRequest(BaseModel):
-    room_id: str
-    player_names: List[str]
+    model_config = _REQUEST_CONFIG
+
+    room_id: RoomId
+    player_names: List[PlayerName] = Field(min_length=1)
     villager_model: str = "gemini-2.0-flash-001"
     werewolf_model: str = "gemini-2.0-flash-001"
 
 
+@app.on_event("startup")
+async def use_eager_tasks():
+    """Run new tasks eagerly until their first suspension (Python 3.12+)."""
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+
+# Background VAD prewarm; referenced so it isn't collected before it finishes
+_prewarm_task: Optional[asyncio.Task] = None
+
+
+@app.on_event("startup")
+async def prewarm_pipeline_pool():
+    """Build VAD analyzers in the background so the first game starts warm."""
+    global _prewarm_task
+    _prewarm_task = asyncio.create_task(vad_pool.prewarm(n=4))
+
+
+@app.on_event("shutdown")
+async def stop_pipeline_prewarm():
+    """Stop the VAD prewarm if it is still running."""
+    if _prewarm_task is not None and not _prewarm_task.done():
+        _prewarm_task.cancel()
+        await asyncio.gather(_prewarm_task, return_exceptions=True)
+
+
+@app.on_event("shutdown")
+async def close_llm_clients():
+    """Release the pooled provider connections."""
+    await apis.aclose()
+
+
+ROOM_ID_ALPHABET = string.ascii_uppercase + string.digits
+
+
 def generate_room_id() -> str:
     """Generate a unique 6-character room ID."""
-    import string
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+    return ''.join(secrets.choice(ROOM_ID_ALPHABET) for _ in range(6))
 
 
 @app.post("/create-room")
@@ -92,23 +210,22 @@ async def create_room(request: CreateRoomRequest):
     try:
         # Generate unique room ID
         room_id = generate_room_id()
-        while room_id in rooms:  # Ensure uniqueness
+        while room_id in rooms:  # Defensive; collisions are vanishingly rare
             room_id = generate_room_id()
         
         # Generate unique room name for LiveKit
         room_name = request.room_name or f"werewolf_game_{uuid.uuid4().hex[:8]}"
         
         # Store room information
-        rooms[room_id] = {
-            "room_name": room_name,
-            "creator": request.creator_name,
-            "players": {request.creator_name: {"ready": False}},
-            "created_at": asyncio.get_event_loop().time(),
-            "game_started": False
-        }
-        room_id_to_name[room_id] = room_name
+        rooms[room_id] = RoomEntry(
+            room_name=room_name,
+            creator=request.creator_name,
+            players={request.creator_name: {"ready": False}},
+            created_at=asyncio.get_running_loop().time(),
+        )
+        room_name_to_id[room_name] = room_id
         
-        logger.info(f"Created room {room_id} ({room_name}) by {request.creator_name}")
+        logger.info("Created room %s (%s) by %s", room_id, room_name, request.creator_name)
         
         return {
             "room_id": room_id,
@@ -118,7 +235,7 @@ async def create_room(request: CreateRoomRequest):
         }
     
     except Exception as e:
-        logger.error(f"Error creating room: {e}")
+        logger.error("Error creating room: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create room: {str(e)}")
 
 
@@ -127,54 +244,41 @@ async def join_room(request: JoinRoomRequest):
     """Join an existing room using room ID and get LiveKit token."""
     try:
         # Check if room exists
-        if request.room_id not in rooms:
+        room = rooms.get(request.room_id)
+        if room is None:
             raise HTTPException(status_code=404, detail="Room not found")
         
-        room_info = rooms[request.room_id]
-        
         # Check if game has already started
-        if room_info["game_started"]:
+        if room.game_started:
             raise HTTPException(status_code=400, detail="Game has already started")
         
         # Check if player name is already taken by someone other than the creator
-        if request.player_name in room_info["players"] and request.player_name != room_info["creator"]:
+        if request.player_name in room.players and request.player_name != room.creator:
             raise HTTPException(status_code=400, detail="Player name already taken in this room")
         
         # Add player to room if not already present
-        if request.player_name not in room_info["players"]:
-            room_info["players"][request.player_name] = {"ready": False}
+        if request.player_name not in room.players:
+            room.players[request.player_name] = {"ready": False}
         
         # Create LiveKit token
-        token = api.AccessToken(LIVEKIT_API_KEY, LIVEKIT_API_SECRET)
-        token.with_identity(request.player_name).with_name(request.player_name)
-        token.with_grants(
-            api.VideoGrants(
-                room_join=True,
-                room=room_info["room_name"],
-                can_publish=True,
-                can_subscribe=True,
-                can_publish_data=True,
-            )
-        )
+        jwt_token = mint_token(request.player_name, request.player_name, room.room_name)
         
-        jwt_token = token.to_jwt()
-        
-        logger.info(f"Player {request.player_name} joined room {request.room_id}")
+        logger.info("Player %s joined room %s", request.player_name, request.room_id)
         
         return {
             "token": jwt_token,
             "url": LIVEKIT_URL,
-            "room_name": room_info["room_name"],
+            "room_name": room.room_name,
             "room_id": request.room_id,
             "participant_id": request.player_name,
-            "players": list(room_info["players"].keys()),
-            "creator": room_info["creator"]
+            "players": list(room.players.keys()),
+            "creator": room.creator
         }
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error joining room: {e}")
+        logger.error("Error joining room: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to join room: {str(e)}")
 
 
@@ -182,47 +286,49 @@ async def join_room(request: JoinRoomRequest):
 async def set_ready(request: SetReadyRequest):
     """Set player ready status in a room."""
     try:
-        if request.room_id not in rooms:
+        room = rooms.get(request.room_id)
+        if room is None:
             raise HTTPException(status_code=404, detail="Room not found")
         
-        room_info = rooms[request.room_id]
-        
-        if request.player_name not in room_info["players"]:
+        player_info = room.players.get(request.player_name)
+        if player_info is None:
             raise HTTPException(status_code=404, detail="Player not found in room")
         
-        room_info["players"][request.player_name]["ready"] = request.is_ready
+        if player_info["ready"] != request.is_ready:
+            room.ready_count += 1 if request.is_ready else -1
+            player_info["ready"] = request.is_ready
         
-        logger.info(f"Player {request.player_name} set ready to {request.is_ready} in room {request.room_id}")
+        logger.info("Player %s set ready to %s in room %s", request.player_name, request.is_ready, request.room_id)
         
         return {
             "message": "Ready status updated",
-            "players": room_info["players"]
+            "players": room.players
         }
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error setting ready status: {e}")
+        logger.error("Error setting ready status: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to set ready status: {str(e)}")
 
 
 @app.get("/room-status/{room_id}")
 async def get_room_status(room_id: str):
     """Get current room status including players and ready states."""
-    if room_id not in rooms:
+    room = rooms.get(room_id)
+    if room is None:
         raise HTTPException(status_code=404, detail="Room not found")
     
-    room_info = rooms[room_id]
-    all_ready = all(player_info["ready"] for player_info in room_info["players"].values())
+    all_ready = room.ready_count == len(room.players)
     
     return {
         "room_id": room_id,
-        "room_name": room_info["room_name"],
-        "creator": room_info["creator"],
-        "players": room_info["players"],
+        "room_name": room.room_name,
+        "creator": room.creator,
+        "players": room.players,
         "all_ready": all_ready,
-        "player_count": len(room_info["players"]),
-        "game_started": room_info["game_started"]
+        "player_count": len(room.players),
+        "game_started": room.game_started
     }
 
 
@@ -231,208 +337,224 @@ async def start_game(request: StartGameRequest):
     """Start a new werewolf game with multiple human players."""
     try:
         # Check if room exists
-        if request.room_id not in rooms:
+        room = rooms.get(request.room_id)
+        if room is None:
             raise HTTPException(status_code=404, detail="Room not found")
         
-        room_info = rooms[request.room_id]
-        room_name = room_info["room_name"]
-        
-        # Check if game already exists for this room
-        if room_name in active_games:
-            raise HTTPException(status_code=400, detail="Game already exists for this room")
-        
-        # Check if all players are ready
-        all_ready = all(room_info["players"][name]["ready"] for name in request.player_names)
-        if not all_ready:
-            raise HTTPException(status_code=400, detail="Not all players are ready")
-        
-        # Mark game as started
-        room_info["game_started"] = True
-        
-        # Get available player names for AI
-        available_ai_names = get_player_names()
-        random.shuffle(available_ai_names)
-        
-        # Remove human player names from available AI names
-        for human_name in request.player_names:
-            if human_name in available_ai_names:
-                available_ai_names.remove(human_name)
-        
-        # Create human players
-        human_players = []
-        for player_name in request.player_names:
-            human_player = PipecatHumanPlayer(name=player_name, role=VILLAGER)  # Role will be assigned later
-            # await human_player.setup_pipecat_pipeline(room_name)
-            human_players.append(human_player)
-        
-        # Calculate remaining AI players needed
-        total_players_needed = 8  # Standard werewolf game size
-        ai_players_needed = max(0, total_players_needed - len(human_players))
-        
-        # Create AI players for remaining slots
-        ai_players = []
-        if ai_players_needed > 0:
-            for i in range(min(ai_players_needed, len(available_ai_names))):
-                # Create AI player as Villager initially (role will be reassigned later)
-                ai_player = Villager(
-                    name=available_ai_names[i],
-                    model=request.villager_model
+        room_name = room.room_name
+        
+        async with room.lock:
+            # Check if game already exists for this room
+            if room.gamemaster is not None:
+                raise HTTPException(status_code=400, detail="Game already exists for this room")
+        
+            # Check if all players are ready
+            all_ready = room.ready_count == len(room.players) and room.players.keys() >= set(request.player_names)
+            if not all_ready:
+                raise HTTPException(status_code=400, detail="Not all players are ready")
+        
+            # Mark game as started
+            room.game_started = True
+        
+            final_players = []
+            try:
+                # Calculate remaining AI players needed
+                total_players_needed = 8  # Standard werewolf game size
+                ai_players_needed = max(0, total_players_needed - len(request.player_names))
+        
+                # Pick only as many AI names as needed, excluding human player names
+                human_set = set(request.player_names)
+                ai_name_pool = [n for n in _ALL_PLAYER_NAMES if n not in human_set]
+                available_ai_names = random.sample(
+                    ai_name_pool, k=min(ai_players_needed, len(ai_name_pool))
                 )
-                # await ai_player.setup_pipecat_pipeline(room_name)
-                ai_players.append(ai_player)
-        
-        # Combine all players
-        all_players = human_players + ai_players
-        
-        # Assign roles randomly
-        roles_to_assign = [SEER, DOCTOR, WEREWOLF, WEREWOLF] + [VILLAGER] * (len(all_players) - 4)
-        random.shuffle(roles_to_assign)
-        
-        # Create role-specific players and assign roles
-        final_players = []
-        for i, player in enumerate(all_players):
-            if i < len(roles_to_assign):
-                role = roles_to_assign[i]
-                name = player.name
-                is_human = isinstance(player, PipecatHumanPlayer)
-                model = request.villager_model if role != WEREWOLF else request.werewolf_model
+        
+                # Create human players
+                human_players = []
+                for player_name in request.player_names:
+                    human_player = PipecatHumanPlayer(name=player_name, role=VILLAGER)  # Role will be assigned later
+                    human_players.append(human_player)
+        
+                # Create AI players for remaining slots
+                ai_players = []
+                for ai_name in available_ai_names:
+                    # Create AI player as Villager initially (role will be reassigned later)
+                    ai_player = Villager(name=ai_name, model=request.villager_model)
+                    ai_players.append(ai_player)
+        
+                # Combine all players
+                all_players = human_players + ai_players
+        
+                # Assign roles randomly
+                roles_to_assign = [SEER, DOCTOR, WEREWOLF, WEREWOLF] + [VILLAGER] * (len(all_players) - 4)
+                random.shuffle(roles_to_assign)
+        
+                # Create role-specific players and assign roles
+                for i, player in enumerate(all_players):
+                    if i < len(roles_to_assign):
+                        role = roles_to_assign[i]
+                        name = player.name
+                        is_human = isinstance(player, PipecatHumanPlayer)
+                        model = request.villager_model if role != WEREWOLF else request.werewolf_model
                 
-                if is_human:
-                    new_player = PipecatHumanPlayer(name=name, role=role)
-                    await new_player.setup_pipecat_pipeline(room_name)
-                else:
-                    if role == SEER:
-                        new_player = Seer(name=name, model=model)
-                    elif role == DOCTOR:
-                        new_player = Doctor(name=name, model=model)
-                    elif role == WEREWOLF:
-                        new_player = Werewolf(name=name, model=model)
-                    else:  # VILLAGER
-                        new_player = Villager(name=name, model=model)
-                    await new_player.setup_pipecat_pipeline(room_name)
+                        if is_human:
+                            new_player = PipecatHumanPlayer(name=name, role=role)
+                        else:
+                            new_player = _ROLE_CLASS[role](name=name, model=model)
                 
-                final_players.append(new_player)
-
-        for player in final_players:
-            if isinstance(player, PipecatHumanPlayer):
-                await player.wait_for_setup()
-        
-        # Organize players by role
-        seer = next((p for p in final_players if p.role == SEER), None)
-        doctor = next((p for p in final_players if p.role == DOCTOR), None)
-        werewolves = [p for p in final_players if p.role == WEREWOLF]
-        villagers = [p for p in final_players if p.role == VILLAGER]
-        
-        if not seer or not doctor or len(werewolves) < 2:
-            raise HTTPException(status_code=500, detail="Failed to assign required roles")
-        
-        # Initialize game view for all players
-        current_player_names = [p.name for p in final_players]
-        
-        for player in final_players:
-            other_wolf = None
-            if player.role == WEREWOLF:
-                other_wolf_player = next((w for w in werewolves if w.name != player.name), None)
-                if other_wolf_player:
-                    other_wolf = other_wolf_player.name
+                        final_players.append(new_player)
+
+                # Pipeline setup is network-bound, so bring all players up concurrently
+                setup_results = await asyncio.gather(
+                    *(p.setup_pipecat_pipeline(room_name) for p in final_players),
+                    return_exceptions=True,
+                )
+                setup_errors = [r for r in setup_results if isinstance(r, Exception)]
+                if setup_errors:
+                    raise setup_errors[0]
+
+                try:
+                    async with asyncio.timeout(HUMAN_SETUP_TIMEOUT):
+                        await asyncio.gather(
+                            *(
+                                p.wait_for_setup()
+                                for p in final_players
+                                if isinstance(p, PipecatHumanPlayer)
+                            )
+                        )
+                except TimeoutError:
+                    raise HTTPException(status_code=504, detail="Players did not join in time")
+        
+                # Organize players by role in a single pass
+                by_role = defaultdict(list)
+                for p in final_players:
+                    by_role[p.role].append(p)
+                seer = by_role[SEER][0] if by_role[SEER] else None
+                doctor = by_role[DOCTOR][0] if by_role[DOCTOR] else None
+                werewolves = by_role[WEREWOLF]
+                villagers = by_role[VILLAGER]
+        
+                if not seer or not doctor or len(werewolves) != 2:
+                    raise HTTPException(status_code=500, detail="Failed to assign required roles")
+        
+                # Initialize game view for all players
+                current_player_names = tuple(p.name for p in final_players)
+                wolf_names = tuple(w.name for w in werewolves)
+        
+                for player in final_players:
+                    other_wolf = None
+                    if player.role == WEREWOLF:
+                        other_wolf = wolf_names[1] if player.name == wolf_names[0] else wolf_names[0]
             
-            player.initialize_game_view(
-                current_players=current_player_names,
-                round_number=0,
-                other_wolf=other_wolf,
-            )
-        
-        # Create game state
-        state = State(
-            villagers=villagers,
-            werewolves=werewolves,
-            seer=seer,
-            doctor=doctor,
-            session_id=room_name,
-        )
+                    player.initialize_game_view(
+                        current_players=current_player_names,
+                        round_number=0,
+                        other_wolf=other_wolf,
+                    )
+        
+                # Create game state
+                state = State(
+                    villagers=villagers,
+                    werewolves=werewolves,
+                    seer=seer,
+                    doctor=doctor,
+                    session_id=room_name,
+                )
         
-        # Create game master
-        gamemaster = game.GameMaster(state, num_threads=2, room_name=room_name)
+                # Create game master
+                gamemaster = game.GameMaster(state, num_threads=2, room_name=room_name)
         
-        # Store active game
-        active_games[room_name] = gamemaster
+                # Store active game
+                room.gamemaster = gamemaster
+            except BaseException:
+                # Roll back so the room can be started again
+                await asyncio.gather(
+                    *(p.cleanup() for p in final_players), return_exceptions=True
+                )
+                room.game_started = False
+                raise
         
-        # Start the game in background
-        asyncio.create_task(run_game_async(room_name, gamemaster))
+            # Start the game in background
+            asyncio.create_task(run_game_async(room))
         
-        # Return game start information
-        player_roles = {player.name: player.role for player in final_players}
+            # Return game start information
+            player_roles = {player.name: player.role for player in final_players}
         
-        logger.info(f"Game started in room {request.room_id} with players: {request.player_names}")
+            logger.info("Game started in room %s with players: %s", request.room_id, request.player_names)
         
-        return {
-            "message": "Game started successfully",
-            "room_id": request.room_id,
-            "room_name": room_name,
-            "players": current_player_names,
-            "human_players": request.player_names,
-            "player_roles": player_roles,
-        }
+            return {
+                "message": "Game started successfully",
+                "room_id": request.room_id,
+                "room_name": room_name,
+                "players": current_player_names,
+                "human_players": request.player_names,
+                "player_roles": player_roles,
+            }
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error starting game: {e}")
+        logger.error("Error starting game: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to start game: {str(e)}")
 
 
-async def run_game_async(room_name: str, gamemaster: game.GameMaster):
+async def run_game_async(room: RoomEntry):
     """Run the game asynchronously in the background."""
+    room_name = room.room_name
+    gamemaster = room.gamemaster
     try:
         winner = await gamemaster.run_game()
-        logger.info(f"Game {room_name} completed. Winner: {winner}")
+        logger.info("Game %s completed. Winner: %s", room_name, winner)
         
         # Clean up player connections
         for player in gamemaster.state.players.values():
             await player.cleanup()
         
         # Clean up room and game state
-        if room_name in active_games:
-            del active_games[room_name]
-            
-        # Find and update room info
-        for room_id, room_info in rooms.items():
-            if room_info["room_name"] == room_name:
-                room_info["game_started"] = False
-                room_info["winner"] = winner
-                break
+        room.gamemaster = None
+        room.game_started = False
+        room.winner = winner
                 
     except Exception as e:
-        logger.error(f"Error running game {room_name}: {e}")
+        logger.error("Error running game %s: %s", room_name, e)
     finally:
         # Ensure cleanup happens even if there's an error
-        if room_name in active_games:
-            del active_games[room_name]
+        room.gamemaster = None
             
         # Try to disconnect any remaining players
         try:
             for player in gamemaster.state.players.values():
                 await player.cleanup()
         except Exception as cleanup_error:
-            logger.error(f"Error during final cleanup: {cleanup_error}")
+            logger.error("Error during final cleanup: %s", cleanup_error)
 
 
 @app.get("/game-status/{room_name}")
 async def get_game_status(room_name: str):
     """Get the current status of a game."""
-    if room_name not in active_games:
+    room = rooms.get(room_name_to_id.get(room_name))
+    gamemaster = room.gamemaster if room is not None else None
+    if gamemaster is None:
         raise HTTPException(status_code=404, detail="Game not found")
     
-    gamemaster = active_games[room_name]
-    
     return {
         "room_name": room_name,
         "current_round": gamemaster.current_round_num,
         "winner": gamemaster.state.winner,
         "players": list(gamemaster.state.players.keys()),
-        "active": room_name in active_games,
+        "active": True,
     }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Rooms and games live in process memory, so extra workers need sticky
+    # routing by room; WEB_CONCURRENCY defaults to a single worker.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "werewolf.main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        http="httptools",
+        loop="uvloop",
+    )
\ No newline at end of file
@@ -10,6 +10,7 @@ class MessageType(enum.Enum):
     GAME_EVENT = "game_event"
     USER_ACTION = "user_action" 
     ANNOUNCEMENT = "announcement"
+    BATCH = "batch"
 
 class GameEventType(enum.Enum):
     PHASE_CHANGE = "phase_change"
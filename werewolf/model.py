@@ -13,15 +13,18 @@
 # limitations under the License.
 
 import enum
+import functools
 import json
+import os
 import random
+import sys
 import asyncio
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
 
 from werewolf.lm import LmLog, generate
 from werewolf.prompts import ACTION_PROMPTS_AND_SCHEMAS
 from werewolf.utils import Deserializable
-from werewolf.config import MAX_DEBATE_TURNS, NUM_PLAYERS
+from werewolf.config import MAX_DEBATE_TURNS, NUM_PLAYERS, NUM_VILLAGERS
 from werewolf.pipecat_ai_player import PipecatAIPlayer
 
 # Role names
@@ -30,6 +33,47 @@ WEREWOLF = "Werewolf"
 SEER = "Seer"
 DOCTOR = "Doctor"
 
+# Seconds a CLI player has to answer a prompt on a terminal
+HUMAN_INPUT_TIMEOUT = 120
+
+# Bytes read from a terminal stdin but not yet consumed as a line; lines typed
+# ahead are kept here since the fd won't signal readable for them again
+_stdin_buffer = bytearray()
+
+
+def _pop_stdin_line() -> Optional[str]:
+    """Take the next complete line typed on stdin, if any."""
+    end = _stdin_buffer.find(b"\n")
+    if end < 0:
+        return None
+    line = _stdin_buffer[:end].decode(errors="replace").rstrip("\r")
+    del _stdin_buffer[: end + 1]
+    return line
+
+
+# `input` call running in a worker thread. A blocked `input` can't be
+# interrupted, so when a prompt times out or is cancelled the thread keeps
+# waiting; its line then answers the next prompt instead of being lost to it.
+_pending_input: Optional[asyncio.Future] = None
+
+
+async def _input_in_thread(prompt: str, timeout: float) -> Optional[str]:
+    """Read a line with `input` in a worker thread, or None after `timeout`."""
+    global _pending_input
+    if _pending_input is None:
+        _pending_input = asyncio.get_running_loop().run_in_executor(None, input, prompt)
+    else:
+        print(prompt, end="", flush=True)
+    try:
+        async with asyncio.timeout(timeout):
+            return await asyncio.shield(_pending_input)
+    except TimeoutError:
+        print("\nNo answer in time.")
+        return None
+    finally:
+        if _pending_input.done():
+            _pending_input = None
+
 
 def group_and_format_observations(observations):
     """Groups observations by round and formats them for output.
@@ -44,9 +88,9 @@ def group_and_format_observations(observations):
 
     grouped = {}
     for obs in observations:
-        round_num = int(obs.split(":", 1)[0].split()[1])
-        obs_text = obs.split(":", 1)[1].strip().replace('"', "")
-        grouped.setdefault(round_num, []).append(obs_text)
+        prefix, obs_text = obs.split(":", 1)
+        round_num = int(prefix.split()[1])
+        grouped.setdefault(round_num, []).append(obs_text.strip().replace('"', ""))
 
     formatted_obs = []
     for round_num, round_obs in sorted(grouped.items()):
@@ -57,15 +101,26 @@ def group_and_format_observations(observations):
     return formatted_obs
 
 
+@functools.lru_cache(maxsize=64)
+def format_announcement(round_number: int, announcement: str) -> str:
+    """Formats a moderator announcement as a round observation.
+
+    Every remaining player receives the same announcement, so the string is
+    built once per round and the same object is shared by all their logs.
+    """
+    return f"Round {round_number}: Moderator Announcement: {announcement}"
+
+
 # JSON serializer that works for nested classes
 class JsonEncoder(json.JSONEncoder):
 
     def default(self, o):
         if isinstance(o, enum.Enum):
             return o.value
-        if isinstance(o, set):
+        if isinstance(o, (set, frozenset)):
             return list(o)
-        return o.__dict__
+        # Underscore attributes are runtime bookkeeping, not game data
+        return {k: v for k, v in o.__dict__.items() if not k.startswith("_")}
 
 
 def to_dict(o: Any) -> Union[Dict[str, Any], List[Any], Any]:
@@ -78,13 +133,23 @@ class GameView:
     def __init__(
         self,
         round_number: int,
-        current_players: List[str],
+        current_players: Sequence[str],
         other_wolf: Optional[str] = None,
+        debate: Optional[List[tuple[str, str]]] = None,
     ):
         self.round_number: int = round_number
-        self.current_players: List[str] = current_players.copy()
-        self.debate: List[tuple[str, str]] = []
+        self.current_players: List[str] = list(current_players)
+        self.debate: List[tuple[str, str]] = debate if debate is not None else []
         self.other_wolf: Optional[str] = other_wolf
+        self._players_except: Dict[Tuple[Optional[str], ...], Tuple[str, ...]] = {}
+
+    def share_debate(self, debate: List[tuple[str, str]]):
+        """Reads the debate from a transcript shared with other players' views.
+
+        Whoever owns the shared list appends each line once; calling
+        update_debate() on every view would then record it repeatedly.
+        """
+        self.debate = debate
 
     def update_debate(self, author: str, dialogue: str):
         """Adds a new dialogue entry to the debate."""
@@ -102,6 +167,20 @@ class GameView:
                 f" {self.current_players}"
             )
         self.current_players.remove(player_to_remove)
+        self._players_except.clear()
+
+    def players_except(self, *excluded: Optional[str]) -> Tuple[str, ...]:
+        """Returns the current players other than `excluded`, in order.
+
+        Results are cached until the next removal, so the action options each
+        player builds every round are computed once per roster.
+        """
+        players = self._players_except.get(excluded)
+        if players is None:
+            players = self._players_except[excluded] = tuple(
+                p for p in self.current_players if p not in excluded
+            )
+        return players
 
     def to_dict(self) -> Any:
         return to_dict(self)
@@ -145,7 +224,14 @@ class Player(PipecatAIPlayer):
 
     def add_announcement(self, announcement: str):
         """Adds the current game announcement to the player's observations."""
-        self._add_observation(f"Moderator Announcement: {announcement}")
+        if not self.gamestate:
+            raise ValueError(
+                "GameView not initialized. Call initialize_game_view() first."
+            )
+
+        self.observations.append(
+            format_announcement(self.gamestate.round_number, announcement)
+        )
 
     def _get_game_state(self) -> Dict[str, Any]:
         """Gets the current game state from the player's perspective."""
@@ -178,10 +264,10 @@ class Player(PipecatAIPlayer):
             "remaining_players": ", ".join(remaining_players),
             "debate": formatted_debate,
             "bidding_rationale": self.bidding_rationale,
-            "debate_turns_left": MAX_DEBATE_TURNS - len(formatted_debate),
+            "debate_turns_left": MAX_DEBATE_TURNS - len(self.gamestate.debate),
             "personality": self.personality,
             "num_players": NUM_PLAYERS,
-            "num_villagers": NUM_PLAYERS - 4,
+            "num_villagers": NUM_VILLAGERS,
         }
 
     async def _generate_action(
@@ -221,9 +307,7 @@ class Player(PipecatAIPlayer):
             raise ValueError(
                 "GameView not initialized. Call initialize_game_view() first."
             )
-        options = [
-            player for player in self.gamestate.current_players if player != self.name
-        ]
+        options = list(self.gamestate.players_except(self.name))
         random.shuffle(options)
         vote, log = await self._generate_action("vote", options)
         # vote, log = options[-1], LmLog(
@@ -354,11 +438,9 @@ class Werewolf(Player):
                 "GameView not initialized. Call initialize_game_view() first."
             )
 
-        options = [
-            player
-            for player in self.gamestate.current_players
-            if player != self.name and player != self.gamestate.other_wolf
-        ]
+        options = list(
+            self.gamestate.players_except(self.name, self.gamestate.other_wolf)
+        )
         random.shuffle(options)
         eliminate, log = await self._generate_action("remove", options)
         # eliminate, log = options[-1], LmLog(
@@ -416,8 +498,8 @@ class Seer(Player):
 
         options = [
             player
-            for player in self.gamestate.current_players
-            if player != self.name and player not in self.previously_unmasked.keys()
+            for player in self.gamestate.players_except(self.name)
+            if player not in self.previously_unmasked
         ]
         random.shuffle(options)
         return await self._generate_action("investigate", options)
@@ -503,11 +585,16 @@ class Round(Deserializable):
       success (bool): Indicates whether the round was completed successfully.
 
     Methods:
+      set_players: Sets the players in this round.
+      has_player: Whether a player is still in this round.
+      remove_player: Removes a player from this round.
       to_dict: Returns a dictionary representation of the round.
     """
 
     def __init__(self):
         self.players: List[str] = []
+        # Mirror of `players` for O(1) membership checks; not serialized
+        self._players_set: Set[str] = set()
         self.eliminated: str | None = None
         self.unmasked: str | None = None
         self.protected: str | None = None
@@ -517,13 +604,29 @@ class Round(Deserializable):
         self.bids: List[Dict[str, int]] = []
         self.success: bool = False
 
+    def set_players(self, players: Sequence[str]):
+        self.players = list(players)
+        self._players_set = set(self.players)
+
+    @property
+    def player_set(self) -> AbstractSet[str]:
+        """Players in this round as a set; modify through set/remove_player."""
+        return self._players_set
+
+    def has_player(self, player: str) -> bool:
+        return player in self._players_set
+
+    def remove_player(self, player: str):
+        self.players.remove(player)
+        self._players_set.discard(player)
+
     def to_dict(self):
         return to_dict(self)
 
     @classmethod
     def from_json(cls, data: Dict[Any, Any]):
         o = cls()
-        o.players = data["players"]
+        o.set_players(data["players"])
         o.eliminated = data.get("eliminated", None)
         o.unmasked = data.get("unmasked", None)
         o.protected = data.get("protected", None)
@@ -545,6 +648,7 @@ class State(Deserializable):
       doctor: The player with the doctor role.
       villagers: List of players with the villager role.
       werewolves: List of players with the werewolf role.
+      werewolf_names: Names of the werewolves.
       rounds: List of Rounds in the game.
       error_message: Contains an error message if the game failed during
         execution.
@@ -567,10 +671,12 @@ class State(Deserializable):
         self.doctor: Doctor = doctor
         self.villagers: List[Villager] = villagers
         self.werewolves: List[Werewolf] = werewolves
-        self.players: Dict[str, Player] = {
-            player.name: player
-            for player in self.villagers + self.werewolves + [self.doctor, self.seer]
-        }
+        all_players = self.villagers + self.werewolves + [self.doctor, self.seer]
+        # Names are compared constantly; interned, equal names are one object
+        for player in all_players:
+            player.name = sys.intern(player.name)
+        self.werewolf_names: FrozenSet[str] = frozenset(w.name for w in werewolves)
+        self.players: Dict[str, Player] = {player.name: player for player in all_players}
         self.rounds: List[Round] = []
         self.error_message: str = ""
         self.winner: str = ""
@@ -716,9 +822,55 @@ class HumanPlayer(Player):
         if self.role == SEER:
             self.previously_unmasked: Dict[str, str] = {}
 
-    def _get_human_input(self, prompt: str) -> str:
-        """Helper to get input from the human player."""
-        return input(prompt)
+    async def _get_human_input(
+        self, prompt: str, timeout: float = HUMAN_INPUT_TIMEOUT
+    ) -> Optional[str]:
+        """Helper to get input from the human player.
+
+        On a terminal the event loop is told when stdin is readable, so waiting
+        for the player does not hold a thread; otherwise `input` runs in one.
+        Either way None is returned if nothing is entered within `timeout`
+        seconds.
+        """
+        loop = asyncio.get_running_loop()
+        if not sys.stdin.isatty():
+            return await _input_in_thread(prompt, timeout)
+
+        line = _pop_stdin_line()
+        if line is not None:
+            print(prompt + line)
+            return line
+
+        future = loop.create_future()
+        fd = sys.stdin.fileno()
+
+        def on_readable():
+            # Read the fd directly; a buffered readline could swallow lines
+            # typed ahead without the fd becoming readable again
+            chunk = os.read(fd, 4096)
+            if future.done():
+                _stdin_buffer.extend(chunk)
+            elif not chunk:
+                future.set_exception(EOFError())
+            else:
+                _stdin_buffer.extend(chunk)
+                line = _pop_stdin_line()
+                if line is not None:
+                    future.set_result(line)
+
+        try:
+            loop.add_reader(fd, on_readable)
+        except NotImplementedError:  # e.g. the Windows proactor loop
+            return await _input_in_thread(prompt, timeout)
+        print(prompt, end="", flush=True)
+        try:
+            async with asyncio.timeout(timeout):
+                return await future
+        except TimeoutError:
+            print("\nNo answer in time.")
+            return None
+        finally:
+            loop.remove_reader(fd)
 
     def _display_gamestate(self):
         """Prints the current game state for the human player."""
@@ -746,8 +898,8 @@ class HumanPlayer(Player):
         print(", ".join(self.gamestate.current_players))
         print("=" * 50)
 
-    def _prompt_for_player_choice(
-        self, options: List[str], prompt_message: str
+    async def _prompt_for_player_choice(
+        self, options: Sequence[str], prompt_message: str
     ) -> str | None:
         """Generic helper to prompt for a player choice from a list."""
         print(prompt_message)
@@ -756,9 +908,13 @@ class HumanPlayer(Player):
 
         while True:
             try:
-                choice_str = self._get_human_input(
+                choice_str = await self._get_human_input(
                     f"Enter your choice (1-{len(options)}): "
                 )
+                if choice_str is None:
+                    choice = random.choice(options)
+                    print(f"Choosing {choice} for you.")
+                    return choice
                 choice = int(choice_str)
                 if 1 <= choice <= len(options):
                     return options[choice - 1]
@@ -768,10 +924,10 @@ class HumanPlayer(Player):
                 print("Invalid input. Please enter a number from the list.")
         return None
 
-    def vote(self) -> tuple[str | None, LmLog]:
+    async def vote(self) -> tuple[str | None, LmLog]:
         self._display_gamestate()
-        options = [p for p in self.gamestate.current_players if p != self.name]
-        voted_player = self._prompt_for_player_choice(
+        options = self.gamestate.players_except(self.name)
+        voted_player = await self._prompt_for_player_choice(
             options, "\nWho do you vote to exile?"
         )
         log = LmLog(
@@ -785,8 +941,8 @@ class HumanPlayer(Player):
             )
         return voted_player, log
 
-    def debate(self) -> tuple[str | None, LmLog]:
-        dialogue = self._get_human_input("What do you say?: ")
+    async def debate(self) -> tuple[str | None, LmLog]:
+        dialogue = await self._get_human_input("What do you say?: ") or ""
         log = LmLog(
             prompt="Human input",
             raw_resp="",
@@ -794,13 +950,13 @@ class HumanPlayer(Player):
         )
         return dialogue, log
 
-    def summarize(self) -> tuple[str | None, LmLog]:
+    async def summarize(self) -> tuple[str | None, LmLog]:
         self._display_gamestate()
         print("\n--- SUMMARIZE THE ROUND ---")
         print(
             "This summary will be added to your private observations for future rounds."
         )
-        summary = self._get_human_input("Your summary: ")
+        summary = await self._get_human_input("Your summary: ") or ""
         self._add_observation(f"Summary: {summary}")
         log = LmLog(
             prompt="Human input",
@@ -811,12 +967,8 @@ class HumanPlayer(Player):
 
     async def eliminate(self) -> tuple[str | None, "LmLog"]:
         self._display_gamestate()
-        options = [
-            p
-            for p in self.gamestate.current_players
-            if p != self.name and p != self.gamestate.other_wolf
-        ]
-        eliminated = self._prompt_for_player_choice(
+        options = self.gamestate.players_except(self.name, self.gamestate.other_wolf)
+        eliminated = await self._prompt_for_player_choice(
             options, "\nAs a Werewolf, who do you choose to eliminate?"
         )
         log = LmLog(
@@ -826,10 +978,10 @@ class HumanPlayer(Player):
         )
         return eliminated, log
 
-    def save(self) -> tuple[str | None, LmLog]:
+    async def save(self) -> tuple[str | None, LmLog]:
         self._display_gamestate()
-        options = list(self.gamestate.current_players)
-        protected = self._prompt_for_player_choice(
+        options = self.gamestate.players_except()
+        protected = await self._prompt_for_player_choice(
             options, "\nAs the Doctor, who do you choose to save?"
         )
         log = LmLog(
@@ -841,14 +993,14 @@ class HumanPlayer(Player):
             self._add_observation(f"During the night, I chose to protect {protected}")
         return protected, log
 
-    def unmask(self) -> tuple[str | None, LmLog]:
+    async def unmask(self) -> tuple[str | None, LmLog]:
         self._display_gamestate()
         options = [
             p
-            for p in self.gamestate.current_players
-            if p != self.name and p not in self.previously_unmasked.keys()
+            for p in self.gamestate.players_except(self.name)
+            if p not in self.previously_unmasked
         ]
-        investigated = self._prompt_for_player_choice(
+        investigated = await self._prompt_for_player_choice(
             options, "\nAs the Seer, who do you choose to investigate?"
         )
         log = LmLog(
@@ -860,12 +1012,12 @@ class HumanPlayer(Player):
 
     # The human does not bid in the same way, but the GameMaster needs a conforming method.
     # The game loop will be modified to not call this for the human player unless they decline to speak.
-    def bid(self) -> tuple[int | None, LmLog]:
+    async def bid(self) -> tuple[int | None, LmLog]:
         """The AI bidding is skipped for humans, but this is here for compliance."""
         # The game master will call get_next_speaker which calls this, so just return a low bid.
         return 0, LmLog(prompt="Human biding skipped", raw_resp="", result={"bid": 0})
 
-    def reveal_and_update(self, player, role):
+    async def reveal_and_update(self, player, role):
         """Called by the GameMaster when the Human is the Seer to update their state."""
         self._add_observation(
             f"During the night, I decided to investigate {player} and learned they are a {role}."
@@ -15,7 +15,7 @@ from werewolf.utils import Deserializable
 from werewolf.pipecat_services.frame_processors import (
     TTSOutputProcessor,
 )
-from werewolf.config import NAMES
+from werewolf.config import LIVEKIT_API_KEY, LIVEKIT_API_SECRET, LIVEKIT_URL, NAMES
 
 logger = logging.getLogger(__name__)
 
@@ -55,9 +55,9 @@ class PipecatAIPlayer(Deserializable):
         self._current_speech_done = asyncio.Event()
         self._current_speech_done.set()  # Start with speech done state
 
-        self.livekit_url = os.getenv("LIVEKIT_URL")
-        self.livekit_api_key = os.getenv("LIVEKIT_API_KEY")
-        self.livekit_api_secret = os.getenv("LIVEKIT_API_SECRET")
+        self.livekit_url = LIVEKIT_URL
+        self.livekit_api_key = LIVEKIT_API_KEY
+        self.livekit_api_secret = LIVEKIT_API_SECRET
 
     def _get_voice_for_name(self, name: str) -> str:
         """Select a consistent Cartesia voice based on the player's name."""
@@ -244,6 +244,7 @@ class PipecatAIPlayer(Deserializable):
             if self._speech_task and not self._speech_task.done():
                 await self._speech_queue.put(None)  # Shutdown signal
                 await self._speech_task
+            self._speech_task = None
 
             if self._pipeline_runner:
                 await self._pipeline_runner.cancel()
@@ -5,6 +5,9 @@ import time
 import os
 import json
 import enum
+from types import MappingProxyType
+
+import orjson
 
 from livekit import api
 from pipecat.pipeline.pipeline import Pipeline
@@ -13,17 +16,33 @@ from pipecat.pipeline.runner import PipelineRunner
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 
+from werewolf.pool import PipelinePool
 from werewolf.pipecat_services.soniox_stt_service import SonioxSTTService
 from werewolf.pipecat_services.livekit_transport import LiveKitTransport, LiveKitParams
 from werewolf.utils import Deserializable
 from werewolf.lm import LmLog
-from werewolf.model import GameView, group_and_format_observations, Player, SEER
-from werewolf.config import MAX_DEBATE_TURNS, NUM_PLAYERS
+from werewolf.model import (
+    GameView,
+    format_announcement,
+    group_and_format_observations,
+    Player,
+    SEER,
+)
+from werewolf.config import (
+    LIVEKIT_API_KEY,
+    LIVEKIT_API_SECRET,
+    LIVEKIT_URL,
+    MAX_DEBATE_TURNS,
+    NUM_PLAYERS,
+    NUM_VILLAGERS,
+)
 from werewolf.pipecat_services.frame_processors import (
     TranscriptionProcessor,
     DataChannelProcessor,
     GameStateProcessor,
     SpeechDetectionProcessor,
+    SpeakingState,
+    parse_data_message,
 )
 
 from .messaging import (
@@ -31,11 +50,40 @@ from .messaging import (
     create_user_action_message,
     create_announcement_message,
     GameEventType,
+    MessageType,
     UserActionType
 )
 
 logger = logging.getLogger(__name__)
 
+# Final transcripts kept between turns; the human may talk while others speak
+TRANSCRIPT_QUEUE_SIZE = 32
+
+# Seconds without a new final transcript after which an utterance is complete
+TRANSCRIPT_QUIET_GAP = 0.25
+
+# Seconds outgoing data messages are held so bursts go out as one packet
+DATA_COALESCE_WINDOW = 0.01
+
+# Messages coalesced by the outbox are already encoded, so batches are spliced
+_BATCH_PREFIX = b'{"type":"%s","messages":[' % MessageType.BATCH.value.encode()
+
+# Fixed prompt bodies; each message still gets its own timestamp
+_BID_PROMPT = {
+    "prompt": "You can speak now if you want to join the debate",
+    "duration": "You have 5 seconds"
+}
+_DEBATE_PROMPT = {
+    "prompt": "It's your turn to speak",
+    "instructions": "Continue speaking and we'll capture your message when you're done"
+}
+
+# Silero loads its ONNX model on construction, so analyzers are kept warm and
+# reused across games instead of being rebuilt for every human player.
+vad_pool: PipelinePool[SileroVADAnalyzer] = PipelinePool(
+    SileroVADAnalyzer, max_size=8, max_age=3600
+)
+
 
 class UserInputTimeout(Exception):
     """Exception raised when user input times out."""
@@ -75,15 +123,26 @@ class PipecatHumanPlayer(Deserializable):
 
         self.participant_id = None
 
+        # Last game state sent to the UI and the fingerprint it was built from
+        self._game_state_cache: Optional[Dict[str, Any]] = None
+        self._game_state_key: Optional[Tuple[Any, ...]] = None
+
         # Data channel message storage
         self._current_vote: Optional[str] = None
         self._current_target_selection: Optional[str] = None
-        self._pending_responses: Dict[str, asyncio.Event] = {}
-        self._response_data: Dict[str, Any] = {}
+        # Data messages waiting to be sent together, and the task sending them
+        self._outbox: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # UI responses being awaited, completed by the data channel handlers
+        self._pending_responses: Dict[str, asyncio.Future] = {}
 
         # STT event handling
         self._user_speaking = False
-        self._last_transcription = ""
+        self._speech_ended = asyncio.Event()
+        self._speech_ended.set()
+        # Final transcripts in arrival order; an utterance may span several
+        self._transcripts: asyncio.Queue = asyncio.Queue(maxsize=TRANSCRIPT_QUEUE_SIZE)
         self._speech_detected_in_window = False
 
         # Pipecat components
@@ -91,20 +150,26 @@ class PipecatHumanPlayer(Deserializable):
         self._pipeline: Optional[Pipeline] = None
         self._pipeline_task: Optional[PipelineTask] = None
         self._pipeline_runner: Optional[PipelineRunner] = None
+        self._vad_analyzer: Optional[SileroVADAnalyzer] = None
+        self.transcription_processor: Optional[TranscriptionProcessor] = None
 
         # Connection state
         self._connected = False
         self._is_human_player_connected = False
 
-        self.livekit_url = os.getenv("LIVEKIT_URL")
-        self.livekit_api_key = os.getenv("LIVEKIT_API_KEY")
-        self.livekit_api_secret = os.getenv("LIVEKIT_API_SECRET")
+        self.livekit_url = LIVEKIT_URL
+        self.livekit_api_key = LIVEKIT_API_KEY
+        self.livekit_api_secret = LIVEKIT_API_SECRET
 
     async def setup_pipecat_pipeline(self, room_name: str):
         """Setup Pipecat pipeline with LiveKit transport for user input."""
-        try:
-            logger.info(f"Setting up Pipecat pipeline for {self.name}")
+        logger.info(f"Setting up Pipecat pipeline for {self.name}")
 
+        # Take a pre-warmed VAD analyzer from the pool. If none is idle a new
+        # one loads its model in a worker thread while the rest is prepared
+        vad_task = asyncio.create_task(vad_pool.acquire())
+        await asyncio.sleep(0)  # let the task hand the model load to its thread
+        try:
             # Generate agent token
             agent_token = api.AccessToken(self.livekit_api_key, self.livekit_api_secret)
             self.participant_id = f"agent_for_{self.name}"
@@ -122,8 +187,16 @@ class PipecatHumanPlayer(Deserializable):
             )
             agent_token_jwt = agent_token.to_jwt()
 
-            # Create VAD analyzer
-            vad_analyzer = SileroVADAnalyzer()
+            # Create STT service
+            stt_service = SonioxSTTService(
+                api_key=os.getenv("SONIOX_API_KEY"),
+                language="en",
+                enable_vad=True,
+                sample_rate=16000,
+            )
+
+            vad_analyzer = await vad_task
+            self._vad_analyzer = vad_analyzer
 
             # Create LiveKit transport
             self._transport = LiveKitTransport(
@@ -146,25 +219,16 @@ class PipecatHumanPlayer(Deserializable):
             async def on_data_received(transport, data: bytes, participant_id: str):
                 await self._on_data_received_bytes(data)
 
-            # Create STT service
-            stt_service = SonioxSTTService(
-                api_key=os.getenv("SONIOX_API_KEY"),
-                language="en",
-                enable_vad=True,
-                sample_rate=16000,
-            )
-
-            # Create frame processors
+            # Create frame processors; both speech observers share one state so
+            # each real speaking edge is reported once
+            speaking_state = SpeakingState()
             self.transcription_processor = TranscriptionProcessor(
-                update_user_speaking_cb=lambda speaking: setattr(
-                    self, "_user_speaking", speaking
-                ),
+                update_user_speaking_cb=self._on_user_speaking,
                 update_speech_detected_cb=lambda detected: setattr(
                     self, "_speech_detected_in_window", detected
                 ),
-                update_transcription_cb=lambda text: setattr(
-                    self, "_last_transcription", text
-                ),
+                update_transcription_cb=self._on_transcription,
+                speaking_state=speaking_state,
             )
 
             data_channel_processor = DataChannelProcessor(
@@ -176,6 +240,8 @@ class PipecatHumanPlayer(Deserializable):
             speech_detection_processor = SpeechDetectionProcessor(
                 speech_threshold=0.3,
                 silence_duration_ms=1000,
+                check_every=3,
+                speaking_state=speaking_state,
             )
 
             # Create pipeline
@@ -238,8 +304,14 @@ class PipecatHumanPlayer(Deserializable):
             
             logger.info(f"Pipecat pipeline setup complete for {self.name}")
 
-        except Exception as e:
-            logger.error(f"Failed to setup Pipecat pipeline for {self.name}: {e}")
+        except BaseException as e:
+            logger.error(f"Failed to setup Pipecat pipeline for {self.name}: {e!r}")
+            if not vad_task.done():
+                vad_task.cancel()
+            elif not vad_task.cancelled() and vad_task.exception() is None:
+                # The analyzer was acquired; hand it back instead of dropping it
+                await vad_pool.release(vad_task.result())
+                self._vad_analyzer = None
             raise
     
     async def wait_for_setup(self):
@@ -250,26 +322,30 @@ class PipecatHumanPlayer(Deserializable):
     async def _on_data_received_bytes(self, data: bytes):
         """Handle incoming data channel messages as bytes."""
         try:
-            message = json.loads(data.decode("utf-8"))
-            message_type = message.get("type")
+            message = parse_data_message(data)
+        except (orjson.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.error(f"Error processing data message: {e}")
+            return
+        if not isinstance(message, MappingProxyType):
+            logger.error(f"Ignoring non-object data message: {message!r}")
+            return
 
-            logger.info(f"Received data message: {message}")
+        message_type = message.get("type")
 
-            if message_type == "vote":
-                target = message.get("target")
-                if target:
-                    self._on_vote_received(target)
+        logger.info(f"Received data message: {message}")
 
-            elif message_type == "target_selection":
-                target = message.get("target")
-                if target:
-                    self._on_target_selection_received(target)
+        if message_type == "vote":
+            target = message.get("target")
+            if target:
+                self._on_vote_received(target)
 
-            # Generic game action handler
-            self._on_game_action_received(message_type, message)
+        elif message_type == "target_selection":
+            target = message.get("target")
+            if target:
+                self._on_target_selection_received(target)
 
-        except (json.JSONDecodeError, Exception) as e:
-            logger.error(f"Error processing data message: {e}")
+        # Generic game action handler
+        self._on_game_action_received(message_type, message)
 
     def _on_vote_received(self, target: str):
         """Handle vote received from UI."""
@@ -277,9 +353,7 @@ class PipecatHumanPlayer(Deserializable):
         logger.info(f"Vote received: {target}")
 
         # Signal any waiting vote response
-        if "vote" in self._pending_responses:
-            self._response_data["vote"] = target
-            self._pending_responses["vote"].set()
+        self._resolve_response("vote", target)
 
     def _on_target_selection_received(self, target: str):
         """Handle target selection received from UI."""
@@ -287,16 +361,20 @@ class PipecatHumanPlayer(Deserializable):
         logger.info(f"Target selection received: {target}")
 
         # Signal any waiting target selection
-        if "target_selection" in self._pending_responses:
-            self._response_data["target_selection"] = target
-            self._pending_responses["target_selection"].set()
+        self._resolve_response("target_selection", target)
+
+    def _resolve_response(self, response_type: str, value: str):
+        """Complete the pending wait for `response_type`, if any."""
+        future = self._pending_responses.get(response_type)
+        if future is not None and not future.done():
+            future.set_result(value)
 
     def _on_game_action_received(self, action_type: str, data: Dict[str, Any]):
         """Handle generic game actions."""
         logger.info(f"Game action received: {action_type}, data: {data}")
 
-    async def send_data_message(self, message: Dict[str, Any]):
-        """Send a message through the data channel."""
+    async def send_data_message(self, message: Union[Dict[str, Any], bytes]):
+        """Send a message, or an already encoded one, through the data channel."""
         if not self._connected or not self._transport:
             logger.warning("Not connected to LiveKit, waiting for connection")
             await self.connected_event.wait()
@@ -304,13 +382,26 @@ class PipecatHumanPlayer(Deserializable):
                 logger.error("Still not connected to LiveKit after waiting")
                 return
 
-        try:
-            await self._transport.send_message(
-                json.dumps(message), participant_id=self.name
-            )
-            logger.info(f"Sent message: {message['type']}")
-        except Exception as e:
-            logger.error(f"Error sending data message: {e}")
+        if not isinstance(message, bytes):
+            message = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+        self._outbox.append(message)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_outbox())
+
+    async def _flush_outbox(self):
+        """Send queued data messages, coalescing those queued close together."""
+        while self._outbox:
+            await asyncio.sleep(DATA_COALESCE_WINDOW)
+            messages, self._outbox = self._outbox, []
+            if len(messages) == 1:
+                payload = messages[0]
+            else:
+                payload = b"".join((_BATCH_PREFIX, b",".join(messages), b"]}"))
+            try:
+                await self._transport.send_message(payload, participant_id=self.name)
+                logger.info("Sent %d message(s)", len(messages))
+            except Exception as e:
+                logger.error(f"Error sending data message: {e}")
 
     def reset_vote(self):
         """Reset the current vote (called at daytime start)."""
@@ -320,12 +411,20 @@ class PipecatHumanPlayer(Deserializable):
     async def disconnect(self):
         """Disconnect from LiveKit and cleanup pipeline."""
         try:
+            if self._flush_task and not self._flush_task.done():
+                await self._flush_task
+            self._flush_task = None
+
             if self._pipeline_runner:
                 await self._pipeline_runner.cancel()
 
             if self._transport:
                 await self._transport.cleanup()
 
+            if self._vad_analyzer:
+                await vad_pool.release(self._vad_analyzer)
+                self._vad_analyzer = None
+
             self._connected = False
             logger.info(f"{self.name} disconnected from LiveKit")
 
@@ -362,7 +461,14 @@ class PipecatHumanPlayer(Deserializable):
 
     def add_announcement(self, announcement: str):
         """Adds the current game announcement to the player's observations."""
-        self._add_observation(f"Moderator Announcement: {announcement}")
+        if not self.gamestate:
+            raise ValueError(
+                "GameView not initialized. Call initialize_game_view() first."
+            )
+
+        self.observations.append(
+            format_announcement(self.gamestate.round_number, announcement)
+        )
 
     def _get_game_state(self) -> Dict[str, Any]:
         """Gets the current game state from the player's perspective."""
@@ -371,11 +477,27 @@ class PipecatHumanPlayer(Deserializable):
                 "GameView not initialized. Call initialize_game_view() first."
             )
 
+        # Observations, the debate and unmasked roles only grow within a round
+        # and players only leave, so their lengths identify the current state
+        gamestate = self.gamestate
+        key = (
+            id(gamestate),
+            gamestate.round_number,
+            len(gamestate.current_players),
+            len(gamestate.debate),
+            len(self.observations),
+            len(getattr(self, "previously_unmasked", ())),
+            self.bidding_rationale,
+        )
+        if key == self._game_state_key:
+            return self._game_state_cache
+
+        display_name = f"{self.name} (You)"
         # Create players array in the format expected by frontend
         players = [
             {
                 "id": player,
-                "name": f"{player} (You)" if player == self.name else player,
+                "name": display_name if player == self.name else player,
                 "isAlive": True,  # Assume alive if they're in current_players
                 "role": self.previously_unmasked.get(player, "unknown") if self.role == SEER else "unknown",  
             }
@@ -384,7 +506,7 @@ class PipecatHumanPlayer(Deserializable):
 
         formatted_debate = [
             (
-                f"{author} (You): {dialogue}"
+                f"{display_name}: {dialogue}"
                 if author == self.name
                 else f"{author}: {dialogue}"
             )
@@ -393,7 +515,8 @@ class PipecatHumanPlayer(Deserializable):
 
         formatted_observations = group_and_format_observations(self.observations)
 
-        return {
+        self._game_state_key = key
+        self._game_state_cache = {
             "name": self.name,
             "role": self.role,
             "round": self.gamestate.round_number,
@@ -401,28 +524,48 @@ class PipecatHumanPlayer(Deserializable):
             "players": players,  # Changed from remaining_players string to players array
             "debate": formatted_debate,
             "bidding_rationale": self.bidding_rationale,
-            "debate_turns_left": MAX_DEBATE_TURNS - len(formatted_debate),
+            "debate_turns_left": MAX_DEBATE_TURNS - len(self.gamestate.debate),
             "personality": self.personality,
             "num_players": NUM_PLAYERS,
-            "num_villagers": NUM_PLAYERS - 4,
+            "num_villagers": NUM_VILLAGERS,
         }
+        return self._game_state_cache
 
     async def wait_for_response(
         self, response_type: str, timeout: float = 30.0
     ) -> Optional[str]:
         """Wait for a response from the UI."""
-        event = asyncio.Event()
-        self._pending_responses[response_type] = event
+        future = asyncio.get_running_loop().create_future()
+        self._pending_responses[response_type] = future
 
         try:
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-            return self._response_data.get(response_type)
+            async with asyncio.timeout(timeout):
+                return await future
         except asyncio.TimeoutError:
             logger.warning(f"Timeout waiting for {response_type} response")
             return None
         finally:
             self._pending_responses.pop(response_type, None)
-            self._response_data.pop(response_type, None)
+
+    async def wait_for_choice(
+        self, response_type: str, options: List[str], timeout: float = 30.0
+    ) -> Optional[str]:
+        """Wait for a response that is one of `options`.
+
+        Invalid responses are ignored and waiting continues, but the timeout
+        covers the whole exchange rather than restarting with each response.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        valid = set(options)
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            choice = await self.wait_for_response(response_type, timeout=remaining)
+            if choice is None or choice in valid:
+                return choice
+            logger.warning(f"Ignoring invalid {response_type} response: {choice}")
 
     async def vote(self) -> Tuple[Optional[str], LmLog]:
         """Check for existing vote or ask user to vote."""
@@ -431,9 +574,7 @@ class PipecatHumanPlayer(Deserializable):
                 "GameView not initialized. Call initialize_game_view() first."
             )
 
-        options = [
-            player for player in self.gamestate.current_players if player != self.name
-        ]
+        options = list(self.gamestate.players_except(self.name))
 
         # Check if vote already exists
         if self._current_vote and self._current_vote in options:
@@ -452,9 +593,9 @@ class PipecatHumanPlayer(Deserializable):
             await self.send_data_message(message)
 
             # Wait for vote response
-            vote = await self.wait_for_response("vote", timeout=60.0)
+            vote = await self.wait_for_choice("vote", options, timeout=60.0)
 
-            if not vote or vote not in options:
+            if not vote:
                 vote = options[0] if options else None
                 logger.warning(f"No valid vote received, defaulting to: {vote}")
 
@@ -475,17 +616,19 @@ class PipecatHumanPlayer(Deserializable):
         """Bid to speak during the debate phase."""
         logger.info(f"Requesting bid from {self.name}")
 
-        # Reset speech detection state
-        self._speech_detected = False
-        self._user_speaking = False
+        # Reset speech detection state; anything transcribed before this turn
+        # is not part of what the player is about to say
+        self._on_user_speaking(False)
+        self._drain_transcripts()
+        if self.transcription_processor is not None:
+            self.transcription_processor.reset_speaking_state()
 
-        # Create an event to signal when speech is detected
-        speech_detected_event = asyncio.Event()
+        # Completed by the first speech detected during this bid
+        speech_detected = asyncio.get_running_loop().create_future()
 
         def on_speech_detected(detected: bool):
-            if detected and not self._speech_detected:
-                self._speech_detected = True
-                speech_detected_event.set()
+            if detected and not speech_detected.done():
+                speech_detected.set_result(True)
 
         # Store and update callback
         original_callback = getattr(
@@ -495,20 +638,15 @@ class PipecatHumanPlayer(Deserializable):
 
         try:
             # Send speaking opportunity message
-            message = create_user_action_message(
-                UserActionType.CAN_SPEAK,
-                {
-                    "prompt": "You can speak now if you want to join the debate",
-                    "duration": "You have 5 seconds"
-                },
-                timeout=5
+            await self.send_data_message(
+                create_user_action_message(UserActionType.CAN_SPEAK, _BID_PROMPT, timeout=5)
             )
-            await self.send_data_message(message)
 
             logger.info(f"Waiting for speech from {self.name}...")
 
             try:
-                await asyncio.wait_for(speech_detected_event.wait(), timeout=5.0)
+                async with asyncio.timeout(5.0):
+                    await speech_detected
                 logger.info(f"Player {self.name} detected speech, bidding to speak")
                 return 1.0, LmLog(
                     prompt="SPEECH_DETECTED",
@@ -538,7 +676,7 @@ class PipecatHumanPlayer(Deserializable):
 
         finally:
             # Restore callback
-            if hasattr(self, "transcription_processor"):
+            if self.transcription_processor is not None:
                 self.transcription_processor._update_speech_detected_cb = original_callback
 
             # Send speaking ended message
@@ -554,23 +692,16 @@ class PipecatHumanPlayer(Deserializable):
     async def debate(self) -> Tuple[Optional[str], LmLog]:
         """Wait for user to stop speaking and get transcription."""
         try:
-            message = create_user_action_message(
-                UserActionType.CAN_SPEAK,
-                {
-                    "prompt": "It's your turn to speak",
-                    "instructions": "Continue speaking and we'll capture your message when you're done"
-                }
+            await self.send_data_message(
+                create_user_action_message(UserActionType.CAN_SPEAK, _DEBATE_PROMPT)
             )
-            await self.send_data_message(message)
 
             # Wait for user to stop speaking
-            while self._user_speaking:
-                await asyncio.sleep(0.1)
+            if self._user_speaking:
+                await self._speech_ended.wait()
 
             # Wait for final transcription
-            await asyncio.sleep(1.0)
-
-            speech = self._last_transcription or ""
+            speech = " ".join(await self._wait_for_transcripts(timeout=1.0))
             self._add_observation(f"I said: {speech}")
 
             log = LmLog(
@@ -586,6 +717,47 @@ class PipecatHumanPlayer(Deserializable):
             log = LmLog(prompt="USER_DEBATE_ERROR", raw_resp="", result={"say": ""})
             return "", log
 
+    def _on_user_speaking(self, speaking: bool):
+        """Track the speaking edge reported by the transcription processor."""
+        self._user_speaking = speaking
+        if speaking:
+            self._speech_ended.clear()
+        else:
+            self._speech_ended.set()
+
+    def _on_transcription(self, text: str):
+        """Queue a final transcript, dropping the oldest if nobody is reading."""
+        if self._transcripts.full():
+            self._transcripts.get_nowait()
+        self._transcripts.put_nowait(text)
+
+    def _drain_transcripts(self) -> List[str]:
+        """Take every final transcript received so far."""
+        transcripts = []
+        while not self._transcripts.empty():
+            transcripts.append(self._transcripts.get_nowait())
+        return transcripts
+
+    async def _wait_for_transcripts(self, timeout: float) -> List[str]:
+        """Take the final transcripts once they go quiet, waiting at most `timeout`.
+
+        STT may emit several finals for one utterance, so after the first one
+        keep collecting until TRANSCRIPT_QUIET_GAP passes without another.
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        transcripts = self._drain_transcripts()
+        try:
+            async with asyncio.timeout_at(deadline):
+                if not transcripts:
+                    transcripts.append(await self._transcripts.get())
+                while True:
+                    transcripts.extend(self._drain_transcripts())
+                    async with asyncio.timeout(TRANSCRIPT_QUIET_GAP):
+                        transcripts.append(await self._transcripts.get())
+        except TimeoutError:
+            pass
+        return transcripts + self._drain_transcripts()
+
     async def summarize(self) -> Tuple[Optional[str], LmLog]:
         """Summarize doesn't need to do anything for human players."""
         log = LmLog(
@@ -601,11 +773,9 @@ class PipecatHumanPlayer(Deserializable):
         if not self.gamestate:
             raise ValueError("GameView not initialized. Call initialize_game_view() first.")
 
-        options = [
-            player
-            for player in self.gamestate.current_players
-            if player != self.name and player != self.gamestate.other_wolf
-        ]
+        options = list(
+            self.gamestate.players_except(self.name, self.gamestate.other_wolf)
+        )
 
         message = create_user_action_message(
             UserActionType.REQUEST_TARGET,
@@ -619,9 +789,9 @@ class PipecatHumanPlayer(Deserializable):
         )
         await self.send_data_message(message)
 
-        target = await self.wait_for_response("target_selection", timeout=60.0)
+        target = await self.wait_for_choice("target_selection", options, timeout=60.0)
 
-        if not target or target not in options:
+        if not target:
             target = options[0] if options else None
             logger.warning(f"No valid elimination target received, defaulting to: {target}")
 
@@ -638,9 +808,7 @@ class PipecatHumanPlayer(Deserializable):
         if not self.gamestate:
             raise ValueError("GameView not initialized. Call initialize_game_view() first.")
 
-        options = [
-            player for player in self.gamestate.current_players if player != self.name
-        ]
+        options = list(self.gamestate.players_except(self.name))
 
         message = create_user_action_message(
             UserActionType.REQUEST_TARGET,
@@ -654,9 +822,9 @@ class PipecatHumanPlayer(Deserializable):
         )
         await self.send_data_message(message)
 
-        target = await self.wait_for_response("target_selection", timeout=60.0)
+        target = await self.wait_for_choice("target_selection", options, timeout=60.0)
 
-        if not target or target not in options:
+        if not target:
             target = options[0] if options else None
             logger.warning(f"No valid investigation target received, defaulting to: {target}")
 
@@ -673,7 +841,7 @@ class PipecatHumanPlayer(Deserializable):
         if not self.gamestate:
             raise ValueError("GameView not initialized. Call initialize_game_view() first.")
 
-        options = list(self.gamestate.current_players)
+        options = list(self.gamestate.players_except())
 
         message = create_user_action_message(
             UserActionType.REQUEST_TARGET,
@@ -687,9 +855,9 @@ class PipecatHumanPlayer(Deserializable):
         )
         await self.send_data_message(message)
 
-        target = await self.wait_for_response("target_selection", timeout=60.0)
+        target = await self.wait_for_choice("target_selection", options, timeout=60.0)
 
-        if not target or target not in options:
+        if not target:
             target = options[0] if options else None
             logger.warning(f"No valid protection target received, defaulting to: {target}")
 
@@ -1,8 +1,13 @@
-import asyncio
-import json
+import functools
 import logging
-from typing import Optional, Callable, Any, Dict
-from dataclasses import dataclass
+import time
+from collections import deque
+from types import MappingProxyType
+from typing import Optional, Callable, Any, Awaitable, Deque, Dict, List, Union
+from dataclasses import dataclass, field
+
+import numpy as np
+import orjson
 
 from pipecat.frames.frames import (
     BotStoppedSpeakingFrame,
@@ -23,6 +28,47 @@ from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_cached(data: Union[bytes, str]) -> Any:
+    message = orjson.loads(data)
+    # Cached objects are shared between callers, so hand out read-only views
+    return MappingProxyType(message) if isinstance(message, dict) else message
+
+
+def parse_data_message(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode a JSON data-channel payload, reusing the result for repeated payloads.
+
+    Raises orjson.JSONDecodeError (a ValueError) for malformed or non-UTF-8 input.
+    """
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    return _parse_cached(data)
+
+
+class FrameDispatch:
+    """Maps a frame's exact type to its handler with one dict lookup per frame.
+
+    Handlers are registered per base class in priority order (first match wins,
+    like an isinstance chain). Each concrete frame type is resolved against them
+    once and memoized, so subclasses keep dispatching to their base's handler.
+    """
+
+    def __init__(self, handlers: Dict[type, Callable[[Frame], Awaitable[None]]]):
+        self._handlers = handlers
+        self._resolved: Dict[type, Optional[Callable[[Frame], Awaitable[None]]]] = {}
+
+    def get(self, frame_type: type) -> Optional[Callable[[Frame], Awaitable[None]]]:
+        try:
+            return self._resolved[frame_type]
+        except KeyError:
+            handler = next(
+                (h for cls, h in self._handlers.items() if issubclass(frame_type, cls)),
+                None,
+            )
+            self._resolved[frame_type] = handler
+            return handler
+
+
 @dataclass
 class TranscriptionCompleteFrame(Frame):
     """Custom frame for when a complete transcription is ready"""
@@ -46,6 +92,28 @@ class SpeechStateFrame(Frame):
     is_speaking: bool
 
 
+@dataclass
+class SpeakingState:
+    """Speaking state of one speaker, shared by every processor that observes them
+
+    Processors report changes through set(); listeners are notified once per
+    real edge no matter which processor noticed it first.
+    """
+
+    is_speaking: bool = False
+    last_speech_ms: int = 0
+    listeners: List[Callable[[bool], None]] = field(default_factory=list)
+
+    def set(self, speaking: bool) -> bool:
+        """Update the state, notifying listeners if it changed. Returns whether it did."""
+        if speaking == self.is_speaking:
+            return False
+        self.is_speaking = speaking
+        for listener in self.listeners:
+            listener(speaking)
+        return True
+
+
 class TranscriptionProcessor(FrameProcessor):
     """Process transcription frames and notify callbacks"""
 
@@ -54,51 +122,61 @@ class TranscriptionProcessor(FrameProcessor):
         update_user_speaking_cb: Optional[Callable[[bool], None]] = None,
         update_speech_detected_cb: Optional[Callable[[bool], None]] = None,
         update_transcription_cb: Optional[Callable[[str], None]] = None,
+        speaking_state: Optional[SpeakingState] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
-        self._update_user_speaking_cb = update_user_speaking_cb
         self._update_speech_detected_cb = update_speech_detected_cb
         self._update_transcription_cb = update_transcription_cb
 
         # Track current transcription state
         self._current_transcription = ""
-        self._is_speaking = False
+        self._speaking_state = speaking_state if speaking_state is not None else SpeakingState()
+        if update_user_speaking_cb:
+            self._speaking_state.listeners.append(update_user_speaking_cb)
+
+        self._dispatch = FrameDispatch(
+            {
+                InterimTranscriptionFrame: self._handle_interim_transcription_frame,
+                TranscriptionFrame: self._handle_transcription_frame,
+                SpeechStateFrame: self._handle_speech_state_frame,
+                TranscriptionCompleteFrame: self._handle_transcription_complete_frame,
+            }
+        )
+
+    def _set_speaking(self, speaking: bool) -> bool:
+        """Record the speaking state; listeners only hear about changes."""
+        return self._speaking_state.set(speaking)
+
+    def reset_speaking_state(self):
+        """Mark the speaker silent without notifying, after the owner reset its own copy."""
+        self._speaking_state.is_speaking = False
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         """Process incoming frames"""
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, InterimTranscriptionFrame):
-            logger.info(f"Interim transcription: {frame.text}")
-            self._update_speech_detected_cb(True)
-            self._update_user_speaking_cb(True)
-
-        # Handle transcription frames
-        if isinstance(frame, TranscriptionFrame):
-            await self._handle_transcription_frame(frame)
-
-        # Handle custom speech state frames
-        elif isinstance(frame, SpeechStateFrame):
-            await self._handle_speech_state_frame(frame)
-
-        # Handle custom transcription complete frames
-        elif isinstance(frame, TranscriptionCompleteFrame):
-            await self._handle_transcription_complete_frame(frame)
+        handler = self._dispatch.get(type(frame))
+        if handler:
+            await handler(frame)
 
         # Pass frame along
         await self.push_frame(frame, direction)
 
+    async def _handle_interim_transcription_frame(self, frame: InterimTranscriptionFrame):
+        """Handle interim transcription frames from STT"""
+        logger.info("Interim transcription: %s", frame.text)
+        if self._update_speech_detected_cb:
+            self._update_speech_detected_cb(True)
+        self._set_speaking(True)
+
     async def _handle_transcription_frame(self, frame: TranscriptionFrame):
         """Handle transcription frames from STT"""
         if frame.text:
             self._current_transcription = frame.text
 
             # Update speaking state if we have text
-            if not self._is_speaking:
-                self._is_speaking = True
-                if self._update_user_speaking_cb:
-                    self._update_user_speaking_cb(True)
+            if self._set_speaking(True):
                 if self._update_speech_detected_cb:
                     self._update_speech_detected_cb(True)
 
@@ -107,18 +185,13 @@ class TranscriptionProcessor(FrameProcessor):
                 self._update_transcription_cb(self._current_transcription)
 
             # Reset speaking state
-            self._is_speaking = False
-            if self._update_user_speaking_cb:
-                self._update_user_speaking_cb(False)
+            self._set_speaking(False)
 
             logger.info(f"Final transcription: {self._current_transcription}")
 
     async def _handle_speech_state_frame(self, frame: SpeechStateFrame):
         """Handle speech state changes"""
-        self._is_speaking = frame.is_speaking
-
-        if self._update_user_speaking_cb:
-            self._update_user_speaking_cb(frame.is_speaking)
+        self._set_speaking(frame.is_speaking)
         if self._update_speech_detected_cb:
             self._update_speech_detected_cb(frame.is_speaking)
 
@@ -132,9 +205,7 @@ class TranscriptionProcessor(FrameProcessor):
             self._update_transcription_cb(frame.text)
 
         # Reset speaking state
-        self._is_speaking = False
-        if self._update_user_speaking_cb:
-            self._update_user_speaking_cb(False)
+        self._set_speaking(False)
 
         logger.info(f"Transcription complete: {frame.text}")
 
@@ -154,53 +225,58 @@ class DataChannelProcessor(FrameProcessor):
         self._on_target_selection_received = on_target_selection_received
         self._on_game_action_received = on_game_action_received
 
+        self._dispatch = FrameDispatch(
+            {
+                DataFrame: self._handle_data_frame,  # from LiveKit data channel
+                GameActionFrame: self._handle_game_action_frame,
+            }
+        )
+
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         """Process incoming frames"""
         await super().process_frame(frame, direction)
 
-        # Handle data frames (from LiveKit data channel)
-        if isinstance(frame, DataFrame):
-            await self._handle_data_frame(frame)
-
-        # Handle custom game action frames
-        elif isinstance(frame, GameActionFrame):
-            await self._handle_game_action_frame(frame)
+        handler = self._dispatch.get(type(frame))
+        if handler:
+            await handler(frame)
 
         # Pass frame along
         await self.push_frame(frame, direction)
 
     async def _handle_data_frame(self, frame: DataFrame):
         """Handle data channel messages"""
+        data = frame.data
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = str(data)
         try:
-            if isinstance(frame.data, bytes):
-                data_str = frame.data.decode("utf-8")
-            else:
-                data_str = str(frame.data)
-
-            message = json.loads(data_str)
-            message_type = message.get("type")
+            message = parse_data_message(data)
+        except (orjson.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.error(f"Error processing data frame: {e}")
+            return
+        if not isinstance(message, MappingProxyType):
+            logger.error(f"Ignoring non-object data message: {message!r}")
+            return
 
-            logger.info(f"Received data message: {message}")
+        message_type = message.get("type")
 
-            if message_type == "vote" and self._on_vote_received:
-                target = message.get("target")
-                if target:
-                    self._on_vote_received(target)
+        logger.info(f"Received data message: {message}")
 
-            elif (
-                message_type == "target_selection"
-                and self._on_target_selection_received
-            ):
-                target = message.get("target")
-                if target:
-                    self._on_target_selection_received(target)
+        if message_type == "vote" and self._on_vote_received:
+            target = message.get("target")
+            if target:
+                self._on_vote_received(target)
 
-            # Generic game action handler
-            if self._on_game_action_received:
-                self._on_game_action_received(message_type, message)
+        elif (
+            message_type == "target_selection"
+            and self._on_target_selection_received
+        ):
+            target = message.get("target")
+            if target:
+                self._on_target_selection_received(target)
 
-        except (json.JSONDecodeError, Exception) as e:
-            logger.error(f"Error processing data frame: {e}")
+        # Generic game action handler
+        if self._on_game_action_received:
+            self._on_game_action_received(message_type, message)
 
     async def _handle_game_action_frame(self, frame: GameActionFrame):
         """Handle custom game action frames"""
@@ -224,26 +300,38 @@ class TTSOutputProcessor(FrameProcessor):
         self._on_speech_end = on_speech_end
         self._is_speaking = False
 
+        self._dispatch = FrameDispatch(
+            {
+                TextFrame: self._handle_text_frame,
+                BotStoppedSpeakingFrame: self._handle_bot_stopped_speaking_frame,
+            }
+        )
+
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         """Process frames for TTS output"""
         await super().process_frame(frame, direction)
 
-        # Handle text frames that need to be spoken
-        if isinstance(frame, TextFrame):
-            logger.info(f"{self.player_name} speaking: {frame.text}")
-            if self._on_speech_start and not self._is_speaking:
-                self._on_speech_start()
-                self._is_speaking = True
+        handler = self._dispatch.get(type(frame))
+        if handler:
+            await handler(frame)
+
+        # Pass frame along to transport
+        await self.push_frame(frame, direction)
 
-        # Handle end of speech
-        elif isinstance(frame, (BotStoppedSpeakingFrame)) and self._is_speaking:
+    async def _handle_text_frame(self, frame: TextFrame):
+        """Handle text frames that need to be spoken"""
+        logger.info(f"{self.player_name} speaking: {frame.text}")
+        if self._on_speech_start and not self._is_speaking:
+            self._on_speech_start()
+            self._is_speaking = True
+
+    async def _handle_bot_stopped_speaking_frame(self, frame: BotStoppedSpeakingFrame):
+        """Handle end of speech"""
+        if self._is_speaking:
             if self._on_speech_end:
                 self._on_speech_end()
             self._is_speaking = False
 
-        # Pass frame along to transport
-        await self.push_frame(frame, direction)
-
 
 class GameStateProcessor(FrameProcessor):
     """Process game state updates and send to clients"""
@@ -256,63 +344,96 @@ class GameStateProcessor(FrameProcessor):
         super().__init__(**kwargs)
         self._send_message_callback = send_message_callback
 
+        self._dispatch = FrameDispatch({DataFrame: self._handle_data_frame})
+
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         """Process game state frames"""
         await super().process_frame(frame, direction)
 
-        # Handle custom game state frames or data frames with game updates
-        if isinstance(frame, DataFrame) and hasattr(frame, "game_state"):
-            if self._send_message_callback:
-                self._send_message_callback(frame.data)
+        handler = self._dispatch.get(type(frame))
+        if handler:
+            await handler(frame)
 
         # Pass frame along
         await self.push_frame(frame, direction)
 
+    async def _handle_data_frame(self, frame: DataFrame):
+        """Handle custom game state frames or data frames with game updates"""
+        if hasattr(frame, "game_state") and self._send_message_callback:
+            self._send_message_callback(frame.data)
+
+
+def _int16_view(buf: Any) -> np.ndarray:
+    """View PCM audio as int16 samples without copying buffer-protocol input."""
+    if isinstance(buf, (bytes, bytearray, memoryview)):
+        return np.frombuffer(buf, dtype=np.int16)
+    return np.asarray(buf, dtype=np.int16)
+
 
 class SpeechDetectionProcessor(FrameProcessor):
-    """Detect speech in audio frames and emit speech state changes"""
+    """Detect speech in audio frames and emit speech state changes
+
+    With check_every > 1, frames are batched and the level check runs once per
+    batch, trading up to check_every frames of detection latency for less
+    per-frame work.
+    """
 
     def __init__(
-        self, speech_threshold: float = 0.3, silence_duration_ms: int = 1000, **kwargs
+        self,
+        speech_threshold: float = 0.3,
+        silence_duration_ms: int = 1000,
+        check_every: int = 1,
+        speaking_state: Optional[SpeakingState] = None,
+        **kwargs,
     ):
         super().__init__(**kwargs)
         self._speech_threshold = speech_threshold
+        # Threshold on mean squared int16 amplitude, equivalent to comparing the
+        # normalized RMS against speech_threshold without a sqrt or float upcast
+        self._threshold_sq = (speech_threshold * 32768.0) ** 2
         self._silence_duration_ms = silence_duration_ms
-        self._last_speech_time = 0
-        self._is_speaking = False
+        self._speaking_state = speaking_state if speaking_state is not None else SpeakingState()
+        self._check_every = max(1, check_every)
+        self._pending_audio: Deque[Any] = deque()
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         """Process audio frames to detect speech"""
         await super().process_frame(frame, direction)
 
         if isinstance(frame, AudioRawFrame):
-            await self._detect_speech_in_audio(frame)
+            self._pending_audio.append(frame.audio)
+            if len(self._pending_audio) >= self._check_every:
+                await self._detect_speech_in_audio(self._pending_audio)
 
         # Pass frame along
         await self.push_frame(frame, direction)
 
-    async def _detect_speech_in_audio(self, frame: AudioRawFrame):
-        """Simple speech detection based on audio level"""
+    async def _detect_speech_in_audio(self, buffers: Deque[Any]):
+        """Simple speech detection based on the level of the batched audio"""
         try:
-            import numpy as np
-
-            # Convert audio data to numpy array
-            audio_data = np.frombuffer(frame.audio, dtype=np.int16)
-
-            # Calculate RMS energy
-            rms = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
-
-            # Normalize to 0-1 range (assuming 16-bit audio)
-            normalized_rms = rms / 32768.0
+            # Sum of squares in the integer domain, per buffer so the batch is
+            # never concatenated; np.dot would accumulate in int16 and
+            # overflow, so ask einsum for an int64 accumulator
+            sq_sum = 0
+            num_samples = 0
+            try:
+                for buf in buffers:
+                    audio_data = _int16_view(buf)
+                    sq_sum += int(
+                        np.einsum("i,i->", audio_data, audio_data, dtype=np.int64)
+                    )
+                    num_samples += audio_data.size
+            finally:
+                buffers.clear()
 
-            current_time = asyncio.get_event_loop().time() * 1000  # ms
+            current_time = time.monotonic_ns() // 1_000_000  # ms
 
-            # Check if speech detected
-            if normalized_rms > self._speech_threshold:
-                self._last_speech_time = current_time
+            # Check if speech detected (mean square above the squared threshold)
+            state = self._speaking_state
+            if sq_sum > self._threshold_sq * num_samples:
+                state.last_speech_ms = current_time
 
-                if not self._is_speaking:
-                    self._is_speaking = True
+                if state.set(True):
                     # Emit speech start frame
                     await self.push_frame(
                         SpeechStateFrame(is_speaking=True), FrameDirection.DOWNSTREAM
@@ -321,12 +442,12 @@ class SpeechDetectionProcessor(FrameProcessor):
             else:
                 # Check if silence duration exceeded
                 if (
-                    self._is_speaking
-                    and current_time - self._last_speech_time
+                    state.is_speaking
+                    and current_time - state.last_speech_ms
                     > self._silence_duration_ms
                 ):
 
-                    self._is_speaking = False
+                    state.set(False)
                     # Emit speech end frame
                     await self.push_frame(
                         SpeechStateFrame(is_speaking=False), FrameDirection.DOWNSTREAM
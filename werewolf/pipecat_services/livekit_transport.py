@@ -6,7 +6,7 @@
 
 import asyncio
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, List, Optional
+from typing import Any, Awaitable, Callable, List, Optional, Union
 
 from loguru import logger
 from pydantic import BaseModel
@@ -499,10 +499,13 @@ class LiveKitOutputTransport(BaseOutputTransport):
         await self._transport.cleanup()
 
     async def send_message(self, frame: TransportMessageFrame | TransportMessageUrgentFrame):
+        data = frame.message
+        if isinstance(data, str):
+            data = data.encode()
         if isinstance(frame, (LiveKitTransportMessageFrame, LiveKitTransportMessageUrgentFrame)):
-            await self._client.send_data(frame.message.encode(), frame.participant_id)
+            await self._client.send_data(data, frame.participant_id)
         else:
-            await self._client.send_data(frame.message.encode())
+            await self._client.send_data(data)
 
     async def write_audio_frame(self, frame: OutputAudioRawFrame):
         livekit_audio = self._convert_pipecat_audio_to_livekit(frame.audio)
@@ -629,7 +632,7 @@ class LiveKitTransport(BaseTransport):
             await self._input.push_app_message(data.decode(), participant_id)
         await self._call_event_handler("on_data_received", data, participant_id)
 
-    async def send_message(self, message: str, participant_id: Optional[str] = None):
+    async def send_message(self, message: Union[str, bytes], participant_id: Optional[str] = None):
         if self._output:
             frame = LiveKitTransportMessageFrame(message=message, participant_id=participant_id)
             await self._output.send_message(frame)
@@ -0,0 +1,78 @@
+"""
+Pool of pre-warmed pipeline components reused across games
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Callable, Deque, Generic, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PipelinePool(Generic[T]):
+    """Hands out pre-built pipeline components instead of constructing them per game.
+
+    Items are created by `factory` in a worker thread (construction usually loads
+    a model or opens a connection) and returned to the pool with `release()`.
+    Idle items older than `max_age` seconds are discarded and rebuilt on demand.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], T],
+        max_size: int = 8,
+        max_age: Optional[float] = None,
+    ):
+        self._factory = factory
+        self._max_size = max_size
+        self._max_age = max_age
+        self._idle: Deque[Tuple[T, float]] = deque()
+
+    async def _create(self) -> T:
+        return await asyncio.to_thread(self._factory)
+
+    def _expired(self, created_at: float) -> bool:
+        return self._max_age is not None and time.monotonic() - created_at > self._max_age
+
+    async def prewarm(self, n: int):
+        """Fill the pool with up to `n` idle items."""
+        missing = min(n, self._max_size) - len(self._idle)
+        if missing <= 0:
+            return
+        try:
+            items = await asyncio.gather(*(self._create() for _ in range(missing)))
+        except Exception as e:
+            logger.error(f"Failed to prewarm pipeline pool: {e}")
+            return
+        now = time.monotonic()
+        self._idle.extend((item, now) for item in items)
+        logger.info(f"Pipeline pool prewarmed with {len(self._idle)} items")
+
+    async def acquire(self) -> T:
+        """Take an idle item, or build a fresh one if none is usable."""
+        while self._idle:
+            item, created_at = self._idle.popleft()
+            if not self._expired(created_at):
+                return item
+        return await self._create()
+
+    async def release(self, item: T):
+        """Return an item to the pool; it is dropped if the pool is full."""
+        if len(self._idle) < self._max_size:
+            self._idle.append((item, time.monotonic()))
+
+    @asynccontextmanager
+    async def connection(self):
+        """Acquire an item for the duration of the `async with` block."""
+        item = await self.acquire()
+        try:
+            yield item
+        finally:
+            await self.release(item)
+
+    def __len__(self) -> int:
+        return len(self._idle)